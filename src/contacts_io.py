@@ -0,0 +1,184 @@
+"""
+Streaming CSV helpers shared by the validation scripts.
+"""
+
+import csv
+import os
+import shutil
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+import pandas as pd
+
+try:
+    # RE2 matches with a DFA in linear time, no backtracking
+    import re2
+except ImportError:
+    re2 = None
+
+# Progress is printed every PROGRESS_EVERY items, or after PROGRESS_SECONDS
+PROGRESS_EVERY = 1000
+PROGRESS_SECONDS = 2.0
+
+# Write buffer for output CSVs
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Shape an address needs before it is worth a network lookup: one '@',
+# no whitespace, and a dot in the domain
+EMAIL_SHAPE = r'^[^@\s]+@[^@\s]+\.[^@\s]+$'
+_EMAIL_SHAPE_RE2 = re2.compile(EMAIL_SHAPE) if re2 else None
+
+
+class ProgressPrinter:
+    """Prints a done/total count at a limited rate, and always at the end."""
+
+    def __init__(self, total, label):
+        self.total = total
+        self.label = label
+        self.done = 0
+        self.next_print = time.monotonic() + PROGRESS_SECONDS
+
+    def advance(self, count=1):
+        """
+        Record finished items, printing if enough items or time have passed.
+
+        Args:
+            count: Number of items finished
+        """
+        self.done += count
+        now = time.monotonic()
+
+        if self.done == self.total or self.done % PROGRESS_EVERY == 0 or now >= self.next_print:
+            print(f"  {self.label}: {self.done}/{self.total}")
+            self.next_print = now + PROGRESS_SECONDS
+
+
+class VerdictPrinter:
+    """
+    Prints one line per checked email (--verbose). Lines are formatted as
+    bytes and written to stdout's binary buffer, which is flushed once at
+    the end rather than per line.
+    """
+
+    def __init__(self, total):
+        self.total = total
+        self.done = 0
+        sys.stdout.flush()  # Keep earlier print() output ahead of these lines
+        self.out = sys.stdout.buffer
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.out.flush()
+
+    def advance(self, email, is_valid, reason):
+        """
+        Print the verdict for one email.
+
+        Args:
+            email: Email address
+            is_valid: Whether the email passed validation
+            reason: Reason it failed validation
+        """
+        self.done += 1
+        if is_valid:
+            self.out.write(b'  %d/%d: OK %s\n' % (self.done, self.total, email.encode()))
+        else:
+            self.out.write(b'  %d/%d: INVALID %s (%s)\n' % (
+                self.done, self.total, email.encode(), reason.encode()))
+
+
+def backup_file(input_path: Path) -> Path:
+    """
+    Back up a file to a timestamped path next to it. The backup is a
+    hardlink when the filesystem allows it (no data copied); output files
+    are always replaced through os.replace, never rewritten in place, so
+    the link keeps the original contents.
+
+    Args:
+        input_path: Path to the file
+
+    Returns:
+        Path of the backup
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = input_path.parent / f"{input_path.stem}_backup_{timestamp}{input_path.suffix}"
+    print(f"Creating backup: {backup_path}")
+
+    try:
+        os.link(input_path, backup_path)
+    except OSError:
+        # Copied by the kernel (sendfile), not through Python memory
+        shutil.copyfile(input_path, backup_path)
+    return backup_path
+
+
+def read_emails(input_path: Path):
+    """
+    Read only the EMAIL column of a contacts CSV. Rows are not kept;
+    write_valid_rows streams them from the file again.
+
+    Args:
+        input_path: Path to the contacts CSV
+
+    Returns:
+        tuple: (header row, stripped email of each contact row)
+    """
+    # Parsed with the same csv.reader rules as write_valid_rows, so the
+    # emails (and the keep flags built from them) line up with its rows
+    with open(input_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        rows = (row for row in reader if row)  # Blank lines are not contacts
+
+        if 'EMAIL' not in header:
+            return header, ['' for _ in rows]
+
+        column = header.index('EMAIL')
+        return header, [row[column].strip() if len(row) > column else '' for row in rows]
+
+
+def well_formed(emails):
+    """
+    Check the shape of many email addresses at once (with RE2 when
+    installed, else vectorized through pandas), so malformed ones are
+    rejected without any DNS or SMTP traffic.
+
+    Args:
+        emails: List of stripped email addresses
+
+    Returns:
+        list: One boolean per address, True where it matches EMAIL_SHAPE
+    """
+    if _EMAIL_SHAPE_RE2 is not None:
+        match = _EMAIL_SHAPE_RE2.match
+        return [match(email) is not None for email in emails]
+
+    return pd.Series(emails, dtype=object).str.match(EMAIL_SHAPE, na=False).tolist()
+
+
+def write_valid_rows(input_path: Path, output_path: Path, keep):
+    """
+    Copy the header and the contact rows flagged in keep from the input
+    CSV to the output CSV, one row at a time. Written through a temporary
+    file, so the output may replace the input.
+
+    Args:
+        input_path: Path to the contacts CSV
+        output_path: Path to write the kept contacts to
+        keep: One boolean per contact row, in file order
+    """
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+
+    with open(input_path, 'r', encoding='utf-8', newline='') as src, \
+         open(tmp_path, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as dst:
+        reader = csv.reader(src)
+        writer = csv.writer(dst)
+        writer.writerow(next(reader, []))
+
+        rows = (row for row in reader if row)
+        writer.writerows(row for row, valid in zip(rows, keep) if valid)
+
+    os.replace(tmp_path, output_path)
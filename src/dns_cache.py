@@ -0,0 +1,183 @@
+"""
+DNS helpers shared by the validation scripts: resolver setup, domain
+extraction and a persistent lookup cache.
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+import dns.rdatatype
+import dns.resolver
+
+# Cache file name, created next to the contacts file being validated
+DNS_CACHE_FILE = '.dns_cache.sqlite3'
+
+# TTL (seconds) for failed lookups whose response carries no SOA record
+DEFAULT_NEGATIVE_TTL = 300
+
+# Short resolver timeouts bound the cost of slow or dead domains (the
+# defaults allow several seconds per query)
+RESOLVER_TIMEOUT = 2.0
+RESOLVER_LIFETIME = 4.0
+
+# Answers kept in each resolver's in-memory cache
+RESOLVER_CACHE_SIZE = 100_000
+
+
+def make_resolver(resolver_class):
+    """
+    Create a resolver with the validators' timeouts and answer cache.
+
+    Args:
+        resolver_class: dns.resolver.Resolver or dns.asyncresolver.Resolver
+
+    Returns:
+        Configured resolver
+    """
+    resolver = resolver_class()
+    resolver.timeout = RESOLVER_TIMEOUT
+    resolver.lifetime = RESOLVER_LIFETIME
+    resolver.cache = dns.resolver.LRUCache(max_size=RESOLVER_CACHE_SIZE)
+    return resolver
+
+
+def extract_domain(email):
+    """Extract domain from email address (None if it has no single '@')."""
+    if not email:
+        return None
+
+    local, at, domain = email.rpartition('@')
+    if not at or '@' in local:
+        return None
+
+    # Most domains are already lowercase; skip the copy for those
+    domain = domain.strip()
+    return domain if domain.islower() else domain.lower()
+
+
+def negative_ttl(error):
+    """
+    Get how long a failed lookup may be cached (RFC 2308): the lower of
+    the SOA record's TTL and its MINIMUM field, from the authority
+    section of the response.
+
+    Args:
+        error: dns.resolver.NXDOMAIN or dns.resolver.NoAnswer
+
+    Returns:
+        int: TTL in seconds
+    """
+    try:
+        if isinstance(error, dns.resolver.NXDOMAIN):
+            responses = list(error.responses().values())
+        else:
+            responses = [error.kwargs['response']]
+    except (AttributeError, KeyError):
+        return DEFAULT_NEGATIVE_TTL
+
+    for response in responses:
+        for rrset in response.authority:
+            if rrset.rdtype == dns.rdatatype.SOA:
+                return min(rrset.ttl, rrset[0].minimum)
+
+    return DEFAULT_NEGATIVE_TTL
+
+
+def is_failure(result):
+    """
+    Check whether a cached result is a failed lookup (see DomainCache.set_failure).
+
+    Args:
+        result: Result returned by DomainCache.get
+
+    Returns:
+        bool: True for a cached NXDOMAIN or NoAnswer
+    """
+    return isinstance(result, dict)
+
+
+def mx_hosts_from_answer(answer):
+    """
+    Get MX host names from an MX answer, ordered by priority.
+
+    Args:
+        answer: dnspython MX answer
+
+    Returns:
+        list: List of MX host names ordered by priority
+    """
+    # Sort by priority (lower is higher priority)
+    mx_hosts = sorted([(r.preference, str(r.exchange).rstrip('.')) for r in answer])
+    return [host for _, host in mx_hosts]
+
+
+class DomainCache:
+    """
+    Caches DNS lookup results on disk, keyed by (domain, record type),
+    until their TTL expires. Results must be JSON serializable.
+    """
+
+    def __init__(self, path: Path):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS dns_cache ('
+            'domain TEXT, rrtype TEXT, result TEXT, expires REAL, '
+            'PRIMARY KEY (domain, rrtype))'
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get(self, domain, rrtype):
+        """
+        Look up a cached result.
+
+        Args:
+            domain: Domain name
+            rrtype: Record type, e.g. 'A' or 'MX'
+
+        Returns:
+            The cached result, or None if missing or expired
+        """
+        row = self.conn.execute(
+            'SELECT result FROM dns_cache WHERE domain = ? AND rrtype = ? AND expires > ?',
+            (domain, rrtype, time.time())
+        ).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def set(self, domain, rrtype, result, ttl):
+        """
+        Store a result for ttl seconds.
+
+        Args:
+            domain: Domain name
+            rrtype: Record type, e.g. 'A' or 'MX'
+            result: Lookup result (not None)
+            ttl: Time to live in seconds
+        """
+        self.conn.execute(
+            'INSERT OR REPLACE INTO dns_cache VALUES (?, ?, ?, ?)',
+            (domain, rrtype, json.dumps(result), time.time() + ttl)
+        )
+
+    def set_failure(self, domain, rrtype, error):
+        """
+        Store a failed lookup for its negative TTL, so dead domains are
+        not queried again on every run.
+
+        Args:
+            domain: Domain name
+            rrtype: Record type, e.g. 'A' or 'MX'
+            error: dns.resolver.NXDOMAIN or dns.resolver.NoAnswer
+        """
+        self.set(domain, rrtype, {'error': type(error).__name__}, negative_ttl(error))
+
+    def close(self):
+        """Save pending results and close the cache."""
+        self.conn.commit()
+        self.conn.close()
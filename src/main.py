@@ -6,17 +6,25 @@ Watches the ingest directory for CSV and Excel files,
 processes them, and outputs consolidated contact data.
 """
 
+import os
 import sys
-import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from typing import List, Optional, Set, Tuple
+import pandas as pd
+from watchfiles import Change, watch
 from parser import FileParser
 from processor import ContactProcessor
 
+# File types picked up from the ingest directory
+SUPPORTED_EXTENSIONS = frozenset({'.csv', '.xlsx', '.xls', '.txt'})
 
-class IngestHandler(FileSystemEventHandler):
-    """Handles file system events in the ingest directory."""
+# Quiet period (ms) after the last change before a batch is processed
+WATCH_STEP_MS = 500
+
+
+class IngestHandler:
+    """Handles file system changes in the ingest directory."""
 
     def __init__(self, parser: FileParser, processor: ContactProcessor, ingest_dir: Path):
         self.parser = parser
@@ -24,20 +32,21 @@ class IngestHandler(FileSystemEventHandler):
         self.ingest_dir = ingest_dir
         self.processing = set()  # Track files currently being processed
 
-    def on_created(self, event):
-        """Called when a file is created in the ingest directory."""
-        if event.is_directory:
-            return
-
-        self.process_file(Path(event.src_path))
+    def handle_changes(self, changes: Set[Tuple[Change, str]]):
+        """
+        Process a batch of changes reported by watchfiles. Each path is
+        processed once per batch, however many events it produced.
 
-    def on_modified(self, event):
-        """Called when a file is modified in the ingest directory."""
-        if event.is_directory:
-            return
+        Args:
+            changes: Set of (change type, path) tuples
+        """
+        # Handle modifications too (some programs create files by writing)
+        paths = {path for change, path in changes if change != Change.deleted}
 
-        # Handle modifications (some programs create files by writing)
-        self.process_file(Path(event.src_path))
+        for path in sorted(paths):
+            file_path = Path(path)
+            if file_path.is_file():
+                self.process_file(file_path)
 
     def process_file(self, file_path: Path):
         """
@@ -47,7 +56,7 @@ class IngestHandler(FileSystemEventHandler):
             file_path: Path to the file to process
         """
         # Only process CSV, Excel, and TXT files
-        if file_path.suffix.lower() not in ['.csv', '.xlsx', '.xls', '.txt']:
+        if file_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
             return
 
         # Avoid processing the same file multiple times
@@ -61,16 +70,12 @@ class IngestHandler(FileSystemEventHandler):
         try:
             self.processing.add(file_path.name)
 
-            # Small delay to ensure file is fully written
-            time.sleep(0.5)
-
-            # Parse the file
-            records = self.parser.parse_file(file_path)
-
-            if records:
-                # Process records
-                self.processor.process_records(records, file_path.name)
+            # Parse the whole file before merging, so a read error part-way
+            # through leaves the contacts untouched; records are still
+            # converted to dictionaries chunk by chunk
+            frames = list(self.parser.iter_records(file_path))
 
+            if self.processor.process_frames(frames, file_path.name):
                 # Save output
                 self.processor.save_output()
 
@@ -81,6 +86,20 @@ class IngestHandler(FileSystemEventHandler):
             self.processing.discard(file_path.name)
 
 
+def parse_one(file_path: Path, cache_dir: Optional[Path]) -> List[pd.DataFrame]:
+    """
+    Parse a single file in a worker process.
+
+    Args:
+        file_path: Path to the file to parse
+        cache_dir: Parsed file cache directory (None disables caching)
+
+    Returns:
+        DataFrames of contact records (cheaper to send back than dicts)
+    """
+    return list(FileParser(cache_dir).iter_records(file_path))
+
+
 def process_existing_files(ingest_dir: Path, parser: FileParser, processor: ContactProcessor):
     """
     Process all existing files in the ingest directory.
@@ -92,9 +111,12 @@ def process_existing_files(ingest_dir: Path, parser: FileParser, processor: Cont
     """
     print("🔍 Scanning for existing files in ingest directory...")
 
-    files = []
-    for ext in ['*.csv', '*.xlsx', '*.xls', '*.txt']:
-        files.extend(ingest_dir.glob(ext))
+    # Single directory pass; scandir entries carry the file type already
+    with os.scandir(ingest_dir) as entries:
+        files = [
+            Path(entry.path) for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+        ]
 
     # Filter out already processed files
     files_to_process = [f for f in files if f.name not in processor.processed_files]
@@ -105,17 +127,24 @@ def process_existing_files(ingest_dir: Path, parser: FileParser, processor: Cont
 
     print(f"📋 Found {len(files_to_process)} unprocessed files")
 
-    for file_path in sorted(files_to_process):
-        try:
-            # Parse the file
-            records = parser.parse_file(file_path)
+    files_to_process = sorted(files_to_process)
+    max_workers = min(len(files_to_process), os.cpu_count() or 1)
+
+    # Parse files in parallel, consolidating in submission order so the
+    # output is deterministic
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(parse_one, file_path, parser.cache_dir) for file_path in files_to_process]
+
+        for file_path, future in zip(files_to_process, futures):
+            try:
+                # Parse the file
+                frames = future.result()
 
-            if records:
                 # Process records
-                processor.process_records(records, file_path.name)
+                processor.process_frames(frames, file_path.name)
 
-        except Exception as e:
-            print(f"❌ Error processing {file_path.name}: {e}")
+            except Exception as e:
+                print(f"❌ Error processing {file_path.name}: {e}")
 
     # Save consolidated output
     processor.save_output()
@@ -140,7 +169,7 @@ def main():
     print(f"📁 Output directory: {output_dir}")
 
     # Initialize parser and processor
-    parser = FileParser()
+    parser = FileParser(cache_dir=output_dir / '.parse_cache')
     processor = ContactProcessor(output_dir)
 
     # Show current stats
@@ -160,19 +189,15 @@ def main():
     print("   (Press Ctrl+C to stop)")
     print("=" * 60 + "\n")
 
-    event_handler = IngestHandler(parser, processor, ingest_dir)
-    observer = Observer()
-    observer.schedule(event_handler, str(ingest_dir), recursive=False)
-    observer.start()
+    handler = IngestHandler(parser, processor, ingest_dir)
 
     try:
-        while True:
-            time.sleep(1)
+        # Changes are coalesced natively and yielded once the directory
+        # has been quiet for WATCH_STEP_MS
+        for changes in watch(ingest_dir, recursive=False, step=WATCH_STEP_MS):
+            handler.handle_changes(changes)
     except KeyboardInterrupt:
         print("\n\n⏹️  Stopping...")
-        observer.stop()
-
-    observer.join()
 
     # Final stats
     stats = processor.get_stats()
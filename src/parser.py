@@ -2,19 +2,153 @@
 Field detection and mapping logic for various input formats.
 """
 
+import codecs
+import csv
+import functools
+import hashlib
+import itertools
+import os
+import pickle
 import re
 import pandas as pd
-import chardet
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
-from schema import FIELD_MAPPINGS, get_output_template
+from schema import EXACT_FIELD_LOOKUP, FIELD_MAPPINGS, OUTPUT_FIELDS
+
+try:
+    # C++ (uchardet) implementation, much faster than pure-Python chardet
+    import cchardet as chardet
+except ImportError:
+    import chardet
+
+try:
+    # Rust-backed Excel reader for both .xlsx and .xls; pandas only
+    # accepts the engine from 2.2, so older versions keep openpyxl/xlrd
+    import python_calamine  # noqa: F401
+    _PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+    EXCEL_ENGINE = 'calamine' if _PANDAS_VERSION >= (2, 2) else None
+except ImportError:
+    EXCEL_ENGINE = None
+
+# Basic email regex pattern, compiled once at import
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Values containing any of these are treated as garbage (Excel errors, etc)
+GARBAGE_PATTERNS = (
+    '#VALUE!',
+    '#REF!',
+    '#DIV/0!',
+    '#N/A',
+    '#NAME?',
+    '#NULL!',
+    '#NUM!',
+    '\ufffc',  # Object replacement character
+)
+_GARBAGE_RE = re.compile('|'.join(map(re.escape, GARBAGE_PATTERNS)))
+
+# Every substring of every lowercased pattern -> patterns containing it,
+# so partial field matching needs no per-pattern scan
+def _build_substring_index(patterns) -> Dict[str, Set[str]]:
+    index = {}
+    for pattern in patterns:
+        for start in range(len(pattern) + 1):
+            for end in range(start, len(pattern) + 1):
+                index.setdefault(pattern[start:end], set()).add(pattern)
+    return index
+
+
+_PATTERN_SUBSTRINGS = _build_substring_index(EXACT_FIELD_LOOKUP)
+
+_MAX_PATTERN_LENGTH = max(map(len, EXACT_FIELD_LOOKUP))
+
+# Substrings (of lowercased text) that indicate a company rather than a person
+COMPANY_INDICATORS = (
+    'ltd', 'limited', 'llc', 'inc', 'corp', 'corporation',
+    'company', 'co.', 'plc', 'gmbh', 'sa', 'ag', 'nv',
+    'pty', 'group', 'holdings', 'enterprises', 'industries',
+    'solutions', 'services', 'consulting', 'technologies',
+    'systems', 'partners', 'associates', 'venture', 'capital',
+    'investment', 'fund', 'management', 'trust', 'foundation',
+    '&', ' and ', ' the ', 'equity', 'ventures', 'advisors',
+    'futures', 'factor'
+)
+_COMPANY_RE = re.compile('|'.join(map(re.escape, COMPANY_INDICATORS)))
+
+# Common person name indicators (substrings), used to rule out all-caps companies
+_PERSON_TITLE_RE = re.compile('dr|mr|ms|mrs')
+
+# A single word repeated, e.g. "covidien covidien"
+_REPEATED_WORD_RE = re.compile(r'^(\S+)(?:\s+\1)+$')
+
+# Output fields holding a person's name
+NAME_FIELDS = frozenset({'FIRSTNAME', 'LASTNAME', 'FULLNAME'})
+
+# FIELD_MAPPINGS with patterns lowercased once at import
+_FIELD_MAPPINGS_LOWER = {
+    output_field: [pattern.lower() for pattern in patterns]
+    for output_field, patterns in FIELD_MAPPINGS.items()
+}
+
+# Rows per chunk when streaming large CSV files
+CSV_CHUNK_SIZE = 50_000
+
+# Lines read when probing for the real header row
+HEADER_SAMPLE_ROWS = 20
+
+# Bytes sampled for encoding detection (accuracy plateaus well before this)
+ENCODING_SAMPLE_SIZE = 32 * 1024
+
+# Bump whenever parsing output changes, so stale cached parses are ignored
+PARSER_VERSION = 2
+
+# Digest of the field mapping config, part of every parse cache key so
+# edits to schema.py invalidate cached parses without a version bump
+_SCHEMA_DIGEST = hashlib.blake2b(
+    repr((FIELD_MAPPINGS, OUTPUT_FIELDS)).encode(), digest_size=16
+).hexdigest()
+
+
+@functools.lru_cache(maxsize=1024)
+def _detect_encoding_cached(path: str, mtime: float, size: int) -> str:
+    """
+    Detect the encoding of a file. Keyed by modification time and size
+    so an edited file is detected again.
+
+    Args:
+        path: Path to the file
+        mtime: Modification time of the file
+        size: Size of the file in bytes
+
+    Returns:
+        Detected encoding name
+    """
+    with open(path, 'rb') as f:
+        raw_data = f.read(ENCODING_SAMPLE_SIZE)
+
+    if raw_data.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+
+    if raw_data.isascii():
+        # Pure 7-bit sample: a single C-level scan, no decoding needed
+        return 'utf-8'
+
+    try:
+        # Most exports are UTF-8 (or ASCII); a strict decode is far
+        # cheaper than statistical detection. The incremental decoder
+        # tolerates a multi-byte character cut off at the sample end.
+        codecs.getincrementaldecoder('utf-8')().decode(raw_data, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        result = chardet.detect(raw_data)
+        return result['encoding'] or 'utf-8'
 
 
 class FileParser:
     """Handles parsing and field mapping for various file formats."""
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = None):
         self.field_map_cache = {}
+        self.cache_dir = cache_dir  # Parsed files cached across runs (None disables)
 
     def is_valid_email(self, email: str) -> bool:
         """
@@ -31,10 +165,35 @@ class FileParser:
 
         email = str(email).strip()
 
-        # Basic email regex pattern
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+        # Cheap shape check before entering the regex engine: the regex
+        # needs a local part, exactly one '@', and a '.' in the domain
+        # followed by 2+ characters
+        if email.count('@') != 1:
+            return False
+
+        at = email.find('@')
+        dot = email.rfind('.')
+        if not 0 < at < dot < len(email) - 2:
+            return False
+
+        return bool(_EMAIL_RE.match(email))
+
+    def is_valid_email_series(self, emails: pd.Series) -> pd.Series:
+        """
+        Vectorized is_valid_email over a Series of cleaned (stripped) strings.
+
+        Args:
+            emails: Series of strings to validate
+
+        Returns:
+            Boolean Series, True where the value is a valid email
+        """
+        # The regex only runs on values with an '@'
+        has_at = emails.str.contains('@', regex=False, na=False)
+        valid = pd.Series(False, index=emails.index)
+        valid[has_at] = emails[has_at].str.match(_EMAIL_RE)
 
-        return bool(re.match(pattern, email))
+        return valid
 
     def contains_garbage(self, value: str) -> bool:
         """
@@ -49,22 +208,19 @@ class FileParser:
         if not value or pd.isna(value):
             return False
 
-        value = str(value).strip()
+        return bool(_GARBAGE_RE.search(str(value)))
+
+    def contains_garbage_series(self, values: pd.Series) -> pd.Series:
+        """
+        Vectorized contains_garbage over a Series of strings.
 
-        # Check for common garbage patterns
-        garbage_patterns = [
-            '#VALUE!',
-            '#REF!',
-            '#DIV/0!',
-            '#N/A',
-            '#NAME?',
-            '#NULL!',
-            '#NUM!',
-            '￼',  # Object replacement character
-            '\ufffc',  # Object replacement character
-        ]
-
-        return any(pattern in value for pattern in garbage_patterns)
+        Args:
+            values: Series of strings to check
+
+        Returns:
+            Boolean Series, True where the value contains garbage
+        """
+        return values.str.contains(_GARBAGE_RE, na=False)
 
     def clean_value(self, value: str) -> str:
         """
@@ -81,8 +237,9 @@ class FileParser:
 
         value = str(value).strip()
 
-        # Return empty if contains garbage
-        if self.contains_garbage(value):
+        # Return empty if contains garbage (value is already a non-empty
+        # string, so skip contains_garbage's NA checks)
+        if _GARBAGE_RE.search(value):
             return ''
 
         return value
@@ -97,60 +254,105 @@ class FileParser:
         Returns:
             Detected encoding name
         """
-        with open(file_path, 'rb') as f:
-            raw_data = f.read(100000)  # Read first 100KB
-            result = chardet.detect(raw_data)
-            return result['encoding'] or 'utf-8'
+        stat = file_path.stat()
+        return _detect_encoding_cached(str(file_path), stat.st_mtime, stat.st_size)
 
-    def read_file(self, file_path: Path) -> Optional[pd.DataFrame]:
+    def read_file(self, file_path: Path, encoding: Optional[str] = None) -> Optional[pd.DataFrame]:
         """
         Read a file (CSV, Excel, or TXT) and return a DataFrame.
         Handles encoding detection and skips header rows.
 
         Args:
             file_path: Path to the file
+            encoding: Known encoding of CSV/TXT files (skips detection)
 
         Returns:
             DataFrame with the file contents, or None if error
         """
+        chunks = list(self.iter_file_chunks(file_path, encoding))
+        if not chunks:
+            return None
+
+        return pd.concat(chunks) if len(chunks) > 1 else chunks[0]
+
+    def iter_file_chunks(self, file_path: Path, encoding: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        """
+        Read a file (CSV, Excel, or TXT) as a sequence of DataFrames.
+        CSV files are streamed in chunks of CSV_CHUNK_SIZE rows so large
+        files are never fully loaded; other formats yield a single frame.
+
+        Args:
+            file_path: Path to the file
+            encoding: Known encoding of CSV/TXT files (skips detection)
+
+        Yields:
+            DataFrames with the file contents, empty rows removed
+
+        Raises:
+            Exception: A read error after some chunks were already yielded,
+                so the file is not taken as parsed with rows missing
+        """
+        is_empty = True
         try:
             file_ext = file_path.suffix.lower()
 
             if file_ext in ['.xlsx', '.xls']:
                 # Read Excel file
-                df = pd.read_excel(file_path, engine='openpyxl' if file_ext == '.xlsx' else 'xlrd')
+                engine = EXCEL_ENGINE or ('openpyxl' if file_ext == '.xlsx' else 'xlrd')
+                chunks = [pd.read_excel(file_path, engine=engine)]
             elif file_ext == '.csv':
-                # Detect encoding
-                encoding = self.detect_encoding(file_path)
+                # Detect encoding unless the caller supplied one
+                encoding = encoding or self.detect_encoding(file_path)
 
-                # Try to read, detecting the right starting row
-                df = self._read_csv_smart(file_path, encoding)
+                # Stream the file, starting from the detected header row
+                chunks = self._read_csv_smart(file_path, encoding)
             elif file_ext == '.txt':
                 # Read text file (one email per line)
-                encoding = self.detect_encoding(file_path)
-                df = self._read_txt_file(file_path, encoding)
+                encoding = encoding or self.detect_encoding(file_path)
+                chunks = [self._read_txt_file(file_path, encoding)]
             else:
                 print(f"  ⚠️  Unsupported file type: {file_ext}")
-                return None
-
-            if df is None or df.empty:
+                return
+
+            for df in chunks or []:
+                if df is None or df.empty:
+                    continue
+                is_empty = False
+
+                # Clean column names
+                df.columns = df.columns.astype(str).str.strip()
+
+                # Remove completely empty rows
+                df = df.dropna(how='all')
+
+                # Remove rows where all values are empty strings. Only possible
+                # when every column holds text, so skip the scan otherwise
+                text_columns = df.select_dtypes(include=['object', 'string']).columns
+                if len(text_columns) == len(df.columns):
+                    try:
+                        # Narrow the candidates column by column; most rows
+                        # drop out at the first column, so later columns are
+                        # only checked for the few rows still blank
+                        blank = pd.Series(True, index=df.index)
+                        for _, column in df.items():
+                            candidates = column[blank]
+                            if candidates.empty:
+                                break
+                            blank[blank] = candidates.str.strip().eq('')
+                        df = df[~blank]
+                    except AttributeError:
+                        # An object column without any strings, so no row is blank
+                        pass
+
+                yield df
+
+            if is_empty:
                 print(f"  ⚠️  File is empty or could not be read")
-                return None
-
-            # Clean column names
-            df.columns = df.columns.astype(str).str.strip()
-
-            # Remove completely empty rows
-            df = df.dropna(how='all')
-
-            # Remove rows where all values are empty strings
-            df = df[~(df.astype(str).apply(lambda x: x.str.strip()) == '').all(axis=1)]
-
-            return df
 
         except Exception as e:
             print(f"  ❌ Error reading file: {e}")
-            return None
+            if not is_empty:
+                raise
 
     def _read_txt_file(self, file_path: Path, encoding: str) -> Optional[pd.DataFrame]:
         """
@@ -164,22 +366,34 @@ class FileParser:
             DataFrame with email column or None
         """
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                lines = f.readlines()
-
-            # Filter out empty lines and strip whitespace
-            emails = [line.strip() for line in lines if line.strip()]
+            # Read whole lines into an EMAIL column; the unit separator is
+            # used as delimiter so commas and quotes are kept verbatim
+            df = pd.read_csv(
+                file_path,
+                sep='\x1f',
+                header=None,
+                names=['EMAIL'],
+                dtype=str,
+                encoding=encoding,
+                quoting=csv.QUOTE_NONE,
+                keep_default_na=False,
+                skip_blank_lines=True
+            )
 
-            # Create DataFrame with EMAIL column
-            df = pd.DataFrame({'EMAIL': emails})
+            # Strip whitespace and filter out empty lines
+            df['EMAIL'] = df['EMAIL'].str.strip()
+            df = df[df['EMAIL'].ne('')]
 
             return df
 
+        except pd.errors.EmptyDataError:
+            return None
+
         except Exception as e:
             print(f"  ⚠️  Error reading text file: {e}")
             return None
 
-    def _read_csv_smart(self, file_path: Path, encoding: str) -> Optional[pd.DataFrame]:
+    def _read_csv_smart(self, file_path: Path, encoding: str) -> Optional[Iterator[pd.DataFrame]]:
         """
         Intelligently read CSV, detecting header rows and skipping metadata.
 
@@ -188,37 +402,66 @@ class FileParser:
             encoding: Detected encoding
 
         Returns:
-            DataFrame or None
+            Iterator of DataFrame chunks, or None
         """
-        # Try reading with different strategies
         try:
-            # First attempt: standard read
-            df = pd.read_csv(file_path, encoding=encoding, on_bad_lines='skip')
-
-            # Check if first few rows look like headers/metadata
-            # Look for a row with multiple non-empty columns as the real header
-            if len(df) > 0:
-                for skip_rows in range(min(5, len(df))):
-                    test_df = pd.read_csv(
-                        file_path,
-                        encoding=encoding,
-                        skiprows=skip_rows,
-                        on_bad_lines='skip'
-                    )
-
-                    if test_df is not None and not test_df.empty:
-                        # Count non-empty column names
-                        non_empty_cols = sum(1 for col in test_df.columns if str(col).strip() and not str(col).startswith('Unnamed'))
-
-                        if non_empty_cols >= 2:  # At least 2 named columns
-                            return test_df
-
-            return df
+            skip_rows = self._detect_skip_rows(file_path, encoding)
+
+            # Map fields from the header alone and load only the mapped
+            # columns (by position, so duplicate names stay unambiguous).
+            # Mapping the reduced frame later gives the same result.
+            header = pd.read_csv(file_path, encoding=encoding, skiprows=skip_rows, nrows=0).columns
+            header = header.astype(str).str.strip()
+            mapped_columns = set(self.map_fields(pd.DataFrame(columns=header)).values())
+            usecols = [index for index, col in enumerate(header) if col in mapped_columns] or None
+
+            return pd.read_csv(
+                file_path,
+                encoding=encoding,
+                skiprows=skip_rows,
+                usecols=usecols,
+                dtype=str,  # Keep values as written, consistently across chunks
+                on_bad_lines='skip',
+                engine='c',
+                chunksize=CSV_CHUNK_SIZE
+            )
 
         except Exception as e:
             print(f"  ⚠️  Error in smart CSV read: {e}")
             return None
 
+    def _detect_skip_rows(self, file_path: Path, encoding: str) -> int:
+        """
+        Find how many leading metadata rows precede the real CSV header.
+        Only the first HEADER_SAMPLE_ROWS lines of the file are read.
+
+        Args:
+            file_path: Path to CSV file
+            encoding: Detected encoding
+
+        Returns:
+            Number of rows to skip before the header
+        """
+        with open(file_path, 'r', encoding=encoding, errors='replace', newline='') as f:
+            rows = csv.reader(itertools.islice(f, HEADER_SAMPLE_ROWS))
+            header_row = None
+
+            # Look for a row with multiple non-empty columns as the real header,
+            # followed by at least one data row. Stops reading as soon as the
+            # header is confirmed, which is the first row for most files.
+            for index, row in enumerate(rows):
+                if header_row is not None:
+                    return header_row
+
+                if index >= 5:
+                    break
+
+                named_cols = sum(1 for cell in row if cell.strip() and not cell.lower().startswith('unnamed'))
+                if named_cols >= 2:  # At least 2 named columns
+                    header_row = index
+
+        return 0
+
     def map_fields(self, df: pd.DataFrame) -> Dict[str, str]:
         """
         Map input DataFrame columns to output schema fields.
@@ -229,26 +472,51 @@ class FileParser:
         Returns:
             Dictionary mapping output field names to input column names
         """
-        field_mapping = {}
+        cache_key = tuple(df.columns)
+        if cache_key in self.field_map_cache:
+            return dict(self.field_map_cache[cache_key])
+
         input_columns = {col.lower(): col for col in df.columns}
 
-        # Try to map each output field to an input column
-        for output_field, patterns in FIELD_MAPPINGS.items():
-            for pattern in patterns:
-                pattern_lower = pattern.lower()
+        # Exact matches: one lookup per input column, keeping the
+        # highest-priority pattern for each output field
+        exact_matches = {}
+        for input_col_lower, input_col_original in input_columns.items():
+            if input_col_lower in EXACT_FIELD_LOOKUP:
+                output_field, priority = EXACT_FIELD_LOOKUP[input_col_lower]
+                if output_field not in exact_matches or priority < exact_matches[output_field][0]:
+                    exact_matches[output_field] = (priority, input_col_original)
+
+        # Partial matches (contains, either way), found with one index
+        # sweep per column instead of testing every (pattern, column) pair.
+        # Maps each pattern to the first input column it matches.
+        partial_matches = {}
+        for input_col_lower, input_col_original in input_columns.items():
+            # Patterns containing the column name
+            matched = set(_PATTERN_SUBSTRINGS.get(input_col_lower, ()))
+
+            # Patterns contained in the column name
+            for start in range(len(input_col_lower)):
+                for end in range(start + 1, min(start + _MAX_PATTERN_LENGTH, len(input_col_lower)) + 1):
+                    if input_col_lower[start:end] in EXACT_FIELD_LOOKUP:
+                        matched.add(input_col_lower[start:end])
+
+            for pattern in matched:
+                partial_matches.setdefault(pattern, input_col_original)
 
-                # Exact match
-                if pattern_lower in input_columns:
-                    field_mapping[output_field] = input_columns[pattern_lower]
-                    break
+        field_mapping = {}
+        for output_field, patterns in _FIELD_MAPPINGS_LOWER.items():
+            if output_field in exact_matches:
+                field_mapping[output_field] = exact_matches[output_field][1]
+                continue
 
-                # Partial match (contains)
-                for input_col_lower, input_col_original in input_columns.items():
-                    if pattern_lower in input_col_lower or input_col_lower in pattern_lower:
-                        if output_field not in field_mapping:  # Prefer first/best match
-                            field_mapping[output_field] = input_col_original
-                            break
+            # Partial match, first pattern that matches wins
+            for pattern_lower in patterns:
+                if pattern_lower in partial_matches:
+                    field_mapping[output_field] = partial_matches[pattern_lower]
+                    break
 
+        self.field_map_cache[cache_key] = dict(field_mapping)
         return field_mapping
 
     def is_likely_company_name(self, text: str) -> bool:
@@ -266,22 +534,9 @@ class FileParser:
 
         text_lower = str(text).strip().lower()
 
-        # Common company indicators
-        company_indicators = [
-            'ltd', 'limited', 'llc', 'inc', 'corp', 'corporation',
-            'company', 'co.', 'plc', 'gmbh', 'sa', 'ag', 'nv',
-            'pty', 'group', 'holdings', 'enterprises', 'industries',
-            'solutions', 'services', 'consulting', 'technologies',
-            'systems', 'partners', 'associates', 'venture', 'capital',
-            'investment', 'fund', 'management', 'trust', 'foundation',
-            '&', ' and ', ' the ', 'equity', 'ventures', 'advisors',
-            'futures', 'factor'
-        ]
-
         # Check for company indicators
-        for indicator in company_indicators:
-            if indicator in text_lower:
-                return True
+        if _COMPANY_RE.search(text_lower):
+            return True
 
         # Additional heuristics for company names
         # If the text is a single word repeated (like "Covidien Covidien"), likely a company
@@ -290,11 +545,37 @@ class FileParser:
             return True
 
         # If text is all caps and contains no common person name indicators, likely a company
-        if text.isupper() and len(text) > 2 and not any(word in text_lower for word in ['dr', 'mr', 'ms', 'mrs']):
+        if text.isupper() and len(text) > 2 and not _PERSON_TITLE_RE.search(text_lower):
             return True
 
         return False
 
+    def is_likely_company_name_series(self, texts: pd.Series) -> pd.Series:
+        """
+        Vectorized is_likely_company_name over a Series of cleaned strings.
+
+        Args:
+            texts: Series of strings to analyze
+
+        Returns:
+            Boolean Series, True where the text is likely a company name
+        """
+        texts_lower = texts.str.strip().str.lower()
+
+        # Check for company indicators
+        is_company = texts_lower.str.contains(_COMPANY_RE, na=False)
+
+        # If the text is a single word repeated (like "Covidien Covidien"), likely a company
+        is_company |= texts_lower.str.match(_REPEATED_WORD_RE, na=False)
+
+        # If text is all caps and contains no common person name indicators, likely a company
+        is_company |= (
+            texts.str.isupper().fillna(False).astype(bool) & texts.str.len().gt(2) &
+            ~texts_lower.str.contains(_PERSON_TITLE_RE, na=False)
+        )
+
+        return is_company
+
     def extract_name_parts(self, fullname: str) -> Tuple[str, str]:
         """
         Extract first and last name from full name.
@@ -336,119 +617,293 @@ class FileParser:
                 # 3 words: first 2 as firstname, last as lastname
                 return ' '.join(parts[:-1]), parts[-1]
 
-    def parse_file(self, file_path: Path) -> List[Dict]:
+    def parse_file(self, file_path: Path, encoding: Optional[str] = None) -> List[Dict]:
         """
         Parse a file and return a list of contact records.
 
         Args:
             file_path: Path to the file
+            encoding: Known encoding of CSV/TXT files (skips detection)
 
         Returns:
             List of dictionaries with standardized fields
         """
+        records = []
+        for chunk in self.iter_records(file_path, encoding):
+            columns = list(chunk.columns)
+            records.extend(dict(zip(columns, row)) for row in chunk.itertuples(index=False, name=None))
+
+        return records
+
+    def iter_records(self, file_path: Path, encoding: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        """
+        Parse a file chunk by chunk, without materializing every record as
+        a dictionary.
+
+        Args:
+            file_path: Path to the file
+            encoding: Known encoding of CSV/TXT files (skips detection)
+
+        Yields:
+            DataFrames of contact records with standardized fields
+        """
         print(f"\n📄 Processing: {file_path.name}")
 
-        # Read the file
-        df = self.read_file(file_path)
-        if df is None or df.empty:
-            return []
+        if self.cache_dir is None:
+            yield from self._parse_records(file_path, encoding)
+            return
+
+        # Unchanged files are loaded from the cache instead of re-parsed
+        stat = file_path.stat()
+        cache_key = (
+            str(file_path.resolve()), stat.st_mtime_ns, stat.st_size, encoding,
+            PARSER_VERSION, _SCHEMA_DIGEST,
+        )
+        digest = hashlib.blake2b(repr(cache_key).encode(), digest_size=16).hexdigest()
+        cache_file = self.cache_dir / f"{digest}.pkl"
+
+        if cache_file.exists():
+            loaded = 0
+            try:
+                for records in self._load_cached(cache_file):
+                    loaded += len(records)
+                    yield records
+                print(f"  📦 Loaded {loaded} contact records from cache")
+                return
+            except Exception as e:
+                if loaded:
+                    raise
+                print(f"  ⚠️  Ignoring unreadable cache entry: {e}")
+
+        # Chunks are pickled one after another as they are parsed, so the
+        # file is never held in memory whole. The entry only replaces
+        # cache_file once the parse has completed without error
+        tmp_file = cache_file.with_suffix('.tmp')
+        cache = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache = open(tmp_file, 'wb')
+        except OSError as e:
+            print(f"  ⚠️  Could not cache parsed file: {e}")
 
-        print(f"  📊 Found {len(df)} rows, {len(df.columns)} columns")
+        completed = False
+        written = 0
+        try:
+            for records in self._parse_records(file_path, encoding):
+                if cache is not None:
+                    try:
+                        pickle.dump(records, cache, protocol=pickle.HIGHEST_PROTOCOL)
+                        written += 1
+                    except OSError as e:
+                        print(f"  ⚠️  Could not cache parsed file: {e}")
+                        cache.close()
+                        cache = None
+
+                yield records
+
+            completed = True
+
+        finally:
+            if cache is not None:
+                cache.close()
+
+            # An unreadable file yields nothing; that is not cached either
+            if cache is not None and completed and written:
+                os.replace(tmp_file, cache_file)
+            else:
+                tmp_file.unlink(missing_ok=True)
 
-        # Map fields
-        field_mapping = self.map_fields(df)
-        print(f"  🗺️  Mapped {len(field_mapping)} fields: {', '.join(field_mapping.keys())}")
+    def _load_cached(self, cache_file: Path) -> Iterator[pd.DataFrame]:
+        """
+        Read the chunks of a cached parse one at a time.
 
-        # Convert to standardized records
-        records = []
+        Args:
+            cache_file: Cache entry written by iter_records
+
+        Yields:
+            DataFrames of contact records with standardized fields
+        """
+        with open(cache_file, 'rb') as f:
+            while True:
+                try:
+                    yield pickle.load(f)
+                except EOFError:
+                    return
+
+    def _parse_records(self, file_path: Path, encoding: Optional[str]) -> Iterator[pd.DataFrame]:
+        """
+        Parse a file chunk by chunk (the uncached part of iter_records).
+
+        Args:
+            file_path: Path to the file
+            encoding: Known encoding of CSV/TXT files (skips detection)
+
+        Yields:
+            DataFrames of contact records with standardized fields
+        """
+        field_mapping = None
+        total_rows = 0
+        total_columns = 0
+        total_records = 0
         skipped_invalid_email = 0
-        skipped_garbage = 0
-
-        for idx, row in df.iterrows():
-            record = get_output_template()
-
-            # Map fields and clean values
-            for output_field, input_column in field_mapping.items():
-                value = row.get(input_column, '')
-                if pd.notna(value):
-                    cleaned_value = self.clean_value(str(value).strip())
-                    record[output_field] = cleaned_value
-
-            # Check if any field contains garbage
-            has_garbage = any(self.contains_garbage(str(v)) for v in record.values() if v)
-            if has_garbage:
-                skipped_garbage += 1
-                continue
 
-            # Validate email address
-            if not record['EMAIL'] or not self.is_valid_email(record['EMAIL']):
-                skipped_invalid_email += 1
-                continue
+        for df in self.iter_file_chunks(file_path, encoding):
+            if field_mapping is None:
+                # Map fields (columns are the same for every chunk)
+                field_mapping = self.map_fields(df)
+                total_columns = len(df.columns)
+                print(f"  🗺️  Mapped {len(field_mapping)} fields: {', '.join(field_mapping.keys())}")
 
-            # Check if any name fields contain company names
-            # If so, clear all name fields
-            has_company_name = (
-                self.is_likely_company_name(record['FIRSTNAME']) or
-                self.is_likely_company_name(record['LASTNAME']) or
-                self.is_likely_company_name(record['FULLNAME'])
-            )
+            total_rows += len(df)
+            chunk, chunk_skipped = self._extract_records(df, field_mapping)
+            skipped_invalid_email += chunk_skipped
+            total_records += len(chunk)
 
-            # Additional check: if firstname, lastname, and fullname are all identical single words,
-            # it's likely a data quality issue or company name - clear all name fields
-            if (record['FIRSTNAME'] and record['LASTNAME'] and record['FULLNAME'] and
-                record['FIRSTNAME'] == record['LASTNAME'] == record['FULLNAME'] and
-                len(record['FULLNAME'].split()) == 1):
-                has_company_name = True
-
-            # Check if any name field matches COMPANYNAME field
-            # If so, it's a company name that was incorrectly placed in person name fields
-            if record.get('COMPANYNAME'):
-                company = record['COMPANYNAME'].strip()
-                if company:
-                    if (record['FIRSTNAME'] == company or
-                        record['LASTNAME'] == company or
-                        record['FULLNAME'] == company):
-                        has_company_name = True
-
-            if has_company_name:
-                # Clear all name fields if company name detected
-                record['FIRSTNAME'] = ''
-                record['LASTNAME'] = ''
-                record['FULLNAME'] = ''
-            else:
-                # Process person names
-
-                # Case 1: firstname and lastname both contain the full name (same value)
-                # Split it properly
-                if (record['FIRSTNAME'] and record['LASTNAME'] and
-                    record['FIRSTNAME'].strip() == record['LASTNAME'].strip() and
-                    ' ' in record['FIRSTNAME'].strip()):
-                    # They both contain the fullname, split it
-                    firstname, lastname = self.extract_name_parts(record['FIRSTNAME'])
-                    record['FIRSTNAME'] = firstname
-                    record['LASTNAME'] = lastname
-                    if not record['FULLNAME']:
-                        record['FULLNAME'] = f"{firstname} {lastname}".strip()
-
-                # Case 2: Handle name splitting if we have FULLNAME but not FIRSTNAME/LASTNAME
-                elif record['FULLNAME'] and (not record['FIRSTNAME'] or not record['LASTNAME']):
-                    firstname, lastname = self.extract_name_parts(record['FULLNAME'])
-                    if not record['FIRSTNAME']:
-                        record['FIRSTNAME'] = firstname
-                    if not record['LASTNAME']:
-                        record['LASTNAME'] = lastname
-
-                # Case 3: Create FULLNAME if we have FIRSTNAME and LASTNAME but not FULLNAME
-                elif not record['FULLNAME'] and (record['FIRSTNAME'] or record['LASTNAME']):
-                    record['FULLNAME'] = f"{record['FIRSTNAME']} {record['LASTNAME']}".strip()
-
-            records.append(record)
+            if not chunk.empty:
+                yield chunk
+
+        if field_mapping is None:
+            return
+
+        print(f"  📊 Found {total_rows} rows, {total_columns} columns")
 
         # Report validation results
         if skipped_invalid_email > 0:
             print(f"  ⚠️  Skipped {skipped_invalid_email} rows with invalid email addresses")
-        if skipped_garbage > 0:
-            print(f"  ⚠️  Skipped {skipped_garbage} rows with garbage data")
 
-        print(f"  ✅ Extracted {len(records)} valid contact records")
-        return records
+        print(f"  ✅ Extracted {total_records} valid contact records")
+
+    def _extract_records(self, df: pd.DataFrame, field_mapping: Dict[str, str]) -> Tuple[pd.DataFrame, int]:
+        """
+        Convert a DataFrame to standardized contact records.
+
+        Args:
+            df: Input DataFrame
+            field_mapping: Output field to input column mapping
+
+        Returns:
+            Tuple of (records DataFrame, number of rows skipped for invalid email)
+        """
+        # Clean each mapped input column once (several fields may share one)
+        # so the cleaning passes run in pandas rather than per row. Missing
+        # values are blanked with a single bulk NA mask.
+        source = df[list(dict.fromkeys(field_mapping.values()))]
+        cleaned = source.astype(str).where(source.notna(), '').apply(lambda s: s.str.strip())
+
+        # Clear values containing garbage (Excel errors, etc)
+        garbage = cleaned.apply(self.contains_garbage_series)
+        cleaned = cleaned.mask(garbage, '')
+
+        # Build the standardized records: select mapped columns under their
+        # output names, then add the unmapped fields as empty strings
+        out = (
+            cleaned[list(field_mapping.values())]
+            .set_axis(list(field_mapping.keys()), axis=1)
+            .reindex(columns=OUTPUT_FIELDS, fill_value='')
+        )
+
+        # Validate email addresses
+        valid_email = self.is_valid_email_series(out['EMAIL'])
+        skipped_invalid_email = int((~valid_email).sum())
+
+        out = out[valid_email].copy()
+
+        # Email-only feeds have no names to clean up
+        if not out.empty and NAME_FIELDS & field_mapping.keys():
+            self._normalize_names(out)
+
+        return out, skipped_invalid_email
+
+    def _normalize_names(self, out: pd.DataFrame):
+        """
+        Clean up person name fields in place: clear names that look like
+        company names, split full names and build missing full names.
+
+        Args:
+            out: DataFrame with standardized fields
+        """
+        firstname = out['FIRSTNAME']
+        lastname = out['LASTNAME']
+        fullname = out['FULLNAME']
+        company = out['COMPANYNAME']
+
+        # Check if any name fields contain company names
+        # If so, clear all name fields
+        has_company_name = (
+            self.is_likely_company_name_series(firstname) |
+            self.is_likely_company_name_series(lastname) |
+            self.is_likely_company_name_series(fullname)
+        )
+
+        # Additional check: if firstname, lastname, and fullname are all identical single words,
+        # it's likely a data quality issue or company name - clear all name fields
+        has_company_name |= (
+            fullname.ne('') & firstname.eq(lastname) & lastname.eq(fullname) &
+            ~fullname.str.contains(r'\s')
+        )
+
+        # Check if any name field matches COMPANYNAME field
+        # If so, it's a company name that was incorrectly placed in person name fields
+        has_company = company.ne('')
+        if has_company.any():
+            has_company_name |= has_company & (
+                firstname.eq(company) | lastname.eq(company) | fullname.eq(company)
+            )
+
+        # Case 1: firstname and lastname both contain the full name (same value)
+        # Split it properly
+        case1 = (
+            ~has_company_name & firstname.ne('') & firstname.eq(lastname) &
+            firstname.str.contains(' ', regex=False)
+        )
+
+        # Case 2: Handle name splitting if we have FULLNAME but not FIRSTNAME/LASTNAME
+        case2 = (
+            ~has_company_name & ~case1 & fullname.ne('') &
+            (firstname.eq('') | lastname.eq(''))
+        )
+
+        # Case 3: Create FULLNAME if we have FIRSTNAME and LASTNAME but not FULLNAME
+        case3 = (
+            ~has_company_name & ~case1 & ~case2 & fullname.eq('') &
+            (firstname.ne('') | lastname.ne(''))
+        )
+
+        split_first, split_last = self.split_names(firstname.where(case1, fullname))
+        joined = (split_first + ' ' + split_last).str.strip()
+        combined = (firstname + ' ' + lastname).str.strip()
+
+        new_firstname = firstname.mask(case1 | (case2 & firstname.eq('')), split_first)
+        new_lastname = lastname.mask(case1 | (case2 & lastname.eq('')), split_last)
+        new_fullname = fullname.mask(case1 & fullname.eq(''), joined).mask(case3, combined)
+
+        # Clear all name fields if company name detected
+        out['FIRSTNAME'] = new_firstname.mask(has_company_name, '')
+        out['LASTNAME'] = new_lastname.mask(has_company_name, '')
+        out['FULLNAME'] = new_fullname.mask(has_company_name, '')
+
+    def split_names(self, fullnames: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """
+        Vectorized extract_name_parts over a Series of full names.
+
+        Args:
+            fullnames: Series of full name strings
+
+        Returns:
+            Tuple of (firstnames, lastnames) Series
+        """
+        # Collapse whitespace so words are separated by single spaces
+        names = fullnames.str.strip().str.replace(r'\s+', ' ', regex=True)
+        word_count = names.str.count(' ') + 1
+
+        # 2-3 words: last word is the lastname
+        simple = names.str.extract(r'^(.*) (\S+)$')
+        # 4+ words: last 2 words are the lastname (compound surnames)
+        compound = names.str.extract(r'^(.*) (\S+ \S+)$')
+
+        is_compound = word_count > 3
+        has_lastname = word_count > 1
+        firstnames = compound[0].where(is_compound, simple[0].where(has_lastname, names))
+        lastnames = compound[1].where(is_compound, simple[1].where(has_lastname, ''))
+
+        return firstnames.fillna(''), lastnames.fillna('')
@@ -4,11 +4,16 @@ Contact processing and deduplication logic.
 
 import pandas as pd
 import hashlib
-import uuid
-from typing import List, Dict, Set
+import os
+import sys
+from typing import Dict, Iterable, List, Set
 from pathlib import Path
 from schema import OUTPUT_FIELDS
 
+# Low-cardinality fields whose values repeat across many contacts; interned
+# so every contact shares one copy of e.g. 'United Kingdom'
+INTERNED_FIELDS = ('COMPANYNAME', 'INTERESTS', 'CITY', 'COUNTRY')
+
 
 class ContactProcessor:
     """Handles contact deduplication and consolidation."""
@@ -20,6 +25,7 @@ class ContactProcessor:
         self.contacts_db: Dict[str, Dict] = {}  # Keyed by dedup key
         self.email_to_key: Dict[str, str] = {}  # Email to dedup key mapping
         self.processed_files: Set[str] = set()
+        self._dirty = False  # Unsaved changes since the last save_output
 
         # Load existing data if it exists
         self._load_existing_data()
@@ -37,21 +43,39 @@ class ContactProcessor:
                 df = pd.read_csv(self.output_file)
                 print(f"📂 Loaded {len(df)} existing contacts from {self.output_file.name}")
 
-                for _, row in df.iterrows():
-                    record = row.to_dict()
-                    email = record.get('EMAIL', '').strip().lower()
+                # Only contacts with an email are kept, so every dedup key
+                # is email-based and can be rebuilt for the whole column
+                emails = df['EMAIL'].fillna('').astype(str).str.strip().str.lower()
+                has_email = emails != ''
+                emails = emails[has_email]
+                dedup_keys = 'email:' + emails
 
-                    if email:
-                        # Reconstruct dedup key
-                        dedup_key = self._generate_dedup_key(record)
-                        self.contacts_db[dedup_key] = record
+                records = [self._intern_values(record) for record in df[has_email].to_dict('records')]
+                self.contacts_db.update(zip(dedup_keys, records))
 
-                        # Index by email
-                        self.email_to_key[email] = dedup_key
+                # Index by email
+                self.email_to_key.update(zip(emails, dedup_keys))
 
             except Exception as e:
                 print(f"⚠️  Error loading existing data: {e}")
 
+    def _intern_values(self, record: Dict) -> Dict:
+        """
+        Intern the string values of INTERNED_FIELDS in place.
+
+        Args:
+            record: Contact record
+
+        Returns:
+            The same record
+        """
+        for field in INTERNED_FIELDS:
+            value = record.get(field)
+            if isinstance(value, str):
+                record[field] = sys.intern(value)
+
+        return record
+
     def _generate_dedup_key(self, record: Dict) -> str:
         """
         Generate a deduplication key for a contact.
@@ -90,8 +114,10 @@ class ContactProcessor:
             else:
                 return f"name:{name_key}"
 
-        # Last resort: generate a unique ID (won't match anything)
-        return f"unique:{uuid.uuid4()}"
+        # Last resort: hash the record contents, so only an identical
+        # record matches
+        digest = hashlib.blake2b(repr(sorted(record.items())).encode(), digest_size=8)
+        return f"anon:{digest.hexdigest()}"
 
     def _merge_records(self, existing: Dict, new: Dict) -> Dict:
         """
@@ -126,6 +152,37 @@ class ContactProcessor:
 
         return merged
 
+    def _add_record(self, record: Dict) -> bool:
+        """
+        Add a contact record, merging it with an existing duplicate.
+
+        Args:
+            record: Contact record
+
+        Returns:
+            True if the record is a new contact, False if it was merged
+        """
+        dedup_key = self._generate_dedup_key(record)
+        self._dirty = True
+
+        if dedup_key in self.contacts_db:
+            # Merge with existing
+            self.contacts_db[dedup_key] = self._merge_records(
+                self.contacts_db[dedup_key],
+                record
+            )
+            return False
+
+        # New contact
+        self.contacts_db[dedup_key] = self._intern_values(record)
+
+        # Index by email
+        email = record.get('EMAIL', '').strip().lower()
+        if email:
+            self.email_to_key[email] = dedup_key
+
+        return True
+
     def process_records(self, records: List[Dict], source_file: str) -> int:
         """
         Process a list of contact records, deduplicating and merging.
@@ -141,34 +198,59 @@ class ContactProcessor:
         updated_count = 0
 
         for record in records:
-            dedup_key = self._generate_dedup_key(record)
-
-            if dedup_key in self.contacts_db:
-                # Merge with existing
-                self.contacts_db[dedup_key] = self._merge_records(
-                    self.contacts_db[dedup_key],
-                    record
-                )
-                updated_count += 1
+            if self._add_record(record):
+                new_count += 1
             else:
-                # New contact
-                self.contacts_db[dedup_key] = record
+                updated_count += 1
 
-                # Index by email
-                email = record.get('EMAIL', '').strip().lower()
-                if email:
-                    self.email_to_key[email] = dedup_key
+        # Mark file as processed
+        self.processed_files.add(source_file)
+        self._dirty = True
 
-                new_count += 1
+        print(f"  📈 Added {new_count} new contacts, updated {updated_count} existing")
+        return new_count
+
+    def process_frames(self, frames: Iterable[pd.DataFrame], source_file: str) -> int:
+        """
+        Process DataFrames of contact records chunk by chunk, deduplicating
+        and merging. Only one chunk is converted to dictionaries at a time.
+        The file is not marked as processed if it yielded no records.
+
+        Args:
+            frames: DataFrames with standardized fields
+            source_file: Source filename
+
+        Returns:
+            Number of records processed (new and updated)
+        """
+        new_count = 0
+        updated_count = 0
+
+        for frame in frames:
+            # Values are plain strings, so skip to_dict's per-value boxing
+            columns = list(frame.columns)
+            for row in frame.itertuples(index=False, name=None):
+                record = dict(zip(columns, row))
+                if self._add_record(record):
+                    new_count += 1
+                else:
+                    updated_count += 1
+
+        if not new_count and not updated_count:
+            return 0
 
         # Mark file as processed
         self.processed_files.add(source_file)
+        self._dirty = True
 
         print(f"  📈 Added {new_count} new contacts, updated {updated_count} existing")
-        return new_count
+        return new_count + updated_count
 
     def save_output(self):
-        """Save the consolidated contacts to CSV."""
+        """Save the consolidated contacts to CSV, if anything changed."""
+        if not self._dirty:
+            return
+
         try:
             # Convert to DataFrame
             records_list = list(self.contacts_db.values())
@@ -185,15 +267,20 @@ class ContactProcessor:
                 na_position='last'
             )
 
-            # Save to CSV
+            # Save to CSV through a temporary file, so the old file (and any
+            # hardlinked backup of it) is replaced, never rewritten in place
             self.output_dir.mkdir(parents=True, exist_ok=True)
-            df.to_csv(self.output_file, index=False, encoding='utf-8')
+            tmp_file = self.output_file.with_name(self.output_file.name + '.tmp')
+            df.to_csv(tmp_file, index=False, encoding='utf-8')
+            os.replace(tmp_file, self.output_file)
 
             # Save processed files log
             with open(self.processed_files_log, 'w') as f:
                 for filename in sorted(self.processed_files):
                     f.write(f"{filename}\n")
 
+            self._dirty = False
+
             print(f"\n💾 Saved {len(df)} total contacts to {self.output_file}")
             print(f"   📋 Email addresses: {df['EMAIL'].notna().sum()}")
             print(f"   👤 Named contacts: {df['FULLNAME'].notna().sum()}")
@@ -98,9 +98,21 @@ FIELD_MAPPINGS = {
     ]
 }
 
+# Reverse lookup for exact matches, built once at import:
+# lowercased input field name -> (output field, pattern priority).
+# Lower priority wins when several patterns for one field match.
+EXACT_FIELD_LOOKUP = {
+    pattern.lower(): (output_field, priority)
+    for output_field, patterns in FIELD_MAPPINGS.items()
+    for priority, pattern in enumerate(patterns)
+}
+
+# Prototype for get_output_template; copied, never handed out directly
+_OUTPUT_TEMPLATE = {field: '' for field in OUTPUT_FIELDS}
+
 
 def get_output_template():
     """
     Returns an empty dictionary with all output fields initialized to empty strings.
     """
-    return {field: '' for field in OUTPUT_FIELDS}
+    return _OUTPUT_TEMPLATE.copy()
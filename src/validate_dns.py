@@ -4,93 +4,212 @@ DNS Validation Script
 
 This script validates email addresses in the consolidated contact list by checking:
 1. Domain exists (has DNS records)
-2. Domain has MX (Mail Exchange) records
+2. Domain has MX (Mail Exchange) records, or an A record to
+   deliver to when it has none (implicit MX)
 
 Emails that fail validation are removed from the output file.
 A backup of the original file is created before modification.
 """
 
-import csv
+import asyncio
+import dns.asyncresolver
 import dns.resolver
 import sys
+from collections import Counter
+from contextlib import nullcontext
 from pathlib import Path
-from datetime import datetime
+from types import SimpleNamespace
+from contacts_io import (ProgressPrinter, VerdictPrinter, backup_file, read_emails, well_formed,
+                         write_valid_rows)
+from dns_cache import (DNS_CACHE_FILE, RESOLVER_TIMEOUT, DomainCache, extract_domain, is_failure,
+                       make_resolver, mx_hosts_from_answer)
 
+try:
+    # c-ares based resolver (C wire parsing), much faster than dnspython
+    import aiodns
+except ImportError:
+    aiodns = None
 
-def extract_domain(email):
-    """Extract domain from email address."""
-    if not email or '@' not in email:
-        return None
-    return email.split('@')[1].strip().lower()
+# Domains validated concurrently (each runs an MX query, then an A query
+# only if the domain has no MX records)
+MAX_CONCURRENT_LOOKUPS = 256
 
+# One shared resolver
+RESOLVER = make_resolver(dns.asyncresolver.Resolver)
 
-def validate_domain_dns(domain):
+
+class AresAnswer(list):
+    """aiodns records, with the rrset.ttl of a dnspython answer."""
+
+    def __init__(self, records):
+        super().__init__(records)
+        self.rrset = SimpleNamespace(ttl=min(r.ttl for r in records))
+
+
+class AresResolver:
+    """
+    Adapts aiodns to the subset of the dnspython resolver interface used
+    here: resolve() returns an answer with rrset.ttl (MX records carry
+    preference/exchange) and failures raise dnspython exceptions.
+    Must be created inside the running event loop.
+    """
+
+    def __init__(self):
+        self.resolver = aiodns.DNSResolver(timeout=RESOLVER_TIMEOUT, tries=2)
+
+    async def resolve(self, domain, rrtype):
+        try:
+            records = await self.resolver.query(domain, rrtype)
+        except aiodns.error.DNSError as e:
+            code = e.args[0] if e.args else None
+            if code == aiodns.error.ARES_ENOTFOUND:
+                raise dns.resolver.NXDOMAIN()
+            if code == aiodns.error.ARES_ENODATA:
+                raise dns.resolver.NoAnswer()
+            if code == aiodns.error.ARES_ETIMEOUT:
+                raise dns.resolver.Timeout()
+            raise
+
+        if not records:
+            raise dns.resolver.NoAnswer()
+
+        if rrtype == 'MX':
+            records = [
+                SimpleNamespace(preference=r.priority, exchange=r.host, ttl=r.ttl)
+                for r in records
+            ]
+
+        return AresAnswer(records)
+
+
+async def validate_domain_dns(domain, resolver, cache):
     """
     Check if domain has DNS records.
 
     Args:
         domain: Domain name to check
+        resolver: Shared dns.asyncresolver.Resolver
+        cache: DomainCache of earlier results
 
     Returns:
         bool: True if domain has DNS records, False otherwise
     """
+    cached = cache.get(domain, 'A')
+    if cached is not None:
+        return not is_failure(cached)
+
     try:
-        dns.resolver.resolve(domain, 'A')
+        answer = await resolver.resolve(domain, 'A')
+        cache.set(domain, 'A', True, answer.rrset.ttl)
         return True
-    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, dns.resolver.Timeout):
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+        cache.set_failure(domain, 'A', e)
+        return False
+    except dns.resolver.Timeout:
         return False
     except Exception as e:
         print(f"  Warning: Unexpected error checking DNS for {domain}: {e}")
         return False
 
 
-def validate_domain_mx(domain):
+async def validate_domain_mx(domain, resolver, cache):
     """
     Check if domain has MX records.
 
     Args:
         domain: Domain name to check
+        resolver: Shared dns.asyncresolver.Resolver
+        cache: DomainCache of earlier results
 
     Returns:
-        bool: True if domain has MX records, False otherwise
+        tuple: (has_mx, no_answer) - no_answer is True when the domain
+        exists but has no MX records
     """
+    mx_hosts = cache.get(domain, 'MX')
+    if mx_hosts is not None:
+        if is_failure(mx_hosts):
+            return False, mx_hosts['error'] == 'NoAnswer'
+        return len(mx_hosts) > 0, False
+
     try:
-        mx_records = dns.resolver.resolve(domain, 'MX')
-        return len(mx_records) > 0
-    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, dns.resolver.Timeout):
-        return False
+        mx_records = await resolver.resolve(domain, 'MX')
+        # Cached as host names, so validate_smtp.py can reuse the entry
+        cache.set(domain, 'MX', mx_hosts_from_answer(mx_records), mx_records.rrset.ttl)
+        return len(mx_records) > 0, False
+    except dns.resolver.NXDOMAIN as e:
+        cache.set_failure(domain, 'MX', e)
+        return False, False
+    except dns.resolver.NoAnswer as e:
+        cache.set_failure(domain, 'MX', e)
+        return False, True
+    except dns.resolver.Timeout:
+        return False, False
     except Exception as e:
         print(f"  Warning: Unexpected error checking MX for {domain}: {e}")
-        return False
+        return False, False
 
 
-def validate_email_dns(email):
+async def validate_domain(domain, resolver, cache):
     """
-    Validate email by checking domain DNS and MX records.
+    Validate an email domain by checking its MX records, falling back to
+    its A record (the implicit MX of RFC 5321 section 5.1) only when the
+    domain exists but has no MX records.
 
     Args:
-        email: Email address to validate
+        domain: Domain name to check
+        resolver: Shared dns.asyncresolver.Resolver
+        cache: DomainCache of earlier results
 
     Returns:
         tuple: (is_valid, reason)
     """
-    domain = extract_domain(email)
-
-    if not domain:
-        return False, "Invalid email format"
-
-    # Check if domain exists
-    if not validate_domain_dns(domain):
+    # MX records imply the domain exists, so most domains need one query.
+    # A and MX are deliberately not queried in parallel: validate_domains
+    # keeps many domains in flight at once, so a run's total time depends
+    # on the number of queries, not on the round trips of any one domain
+    has_mx, no_answer = await validate_domain_mx(domain, resolver, cache)
+    if has_mx:
+        return True, "Valid"
+
+    # NXDOMAIN (or a failed lookup) is conclusive; skip the A query
+    if not no_answer:
         return False, "Domain does not exist"
 
-    # Check if domain has MX records
-    if not validate_domain_mx(domain):
+    # Mail is delivered to the domain's own address when it has no MX
+    if not await validate_domain_dns(domain, resolver, cache):
         return False, "No MX records found"
 
     return True, "Valid"
 
 
-def process_contacts_file(input_file, output_file=None, create_backup=True):
+async def validate_domains(domains, cache):
+    """
+    Validate many domains concurrently, with at most MAX_CONCURRENT_LOOKUPS
+    in flight at once.
+
+    Args:
+        domains: List of unique domain names
+        cache: DomainCache of earlier results
+
+    Returns:
+        dict: Domain -> (is_valid, reason)
+    """
+    resolver = AresResolver() if aiodns else RESOLVER
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+    progress = ProgressPrinter(len(domains), "Domains checked")
+
+    async def bounded(domain):
+        async with semaphore:
+            result = await validate_domain(domain, resolver, cache)
+
+        progress.advance()
+        return result
+
+    results = await asyncio.gather(*(bounded(domain) for domain in domains))
+    return dict(zip(domains, results))
+
+
+def process_contacts_file(input_file, output_file=None, create_backup=True, verbose=False):
     """
     Process contacts file and remove entries with invalid email addresses.
 
@@ -98,6 +217,7 @@ def process_contacts_file(input_file, output_file=None, create_backup=True):
         input_file: Path to input CSV file
         output_file: Path to output CSV file (defaults to overwriting input)
         create_backup: Whether to create a backup of the original file
+        verbose: If True, print the verdict for every contact
     """
     input_path = Path(input_file)
 
@@ -113,71 +233,68 @@ def process_contacts_file(input_file, output_file=None, create_backup=True):
 
     # Create backup if requested
     if create_backup:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = input_path.parent / f"{input_path.stem}_backup_{timestamp}{input_path.suffix}"
-        print(f"Creating backup: {backup_path}")
+        backup_file(input_path)
 
-        with open(input_path, 'r', encoding='utf-8') as src, \
-             open(backup_path, 'w', encoding='utf-8', newline='') as dst:
-            dst.write(src.read())
-
-    # Read all contacts
+    # Read the email addresses; rows are streamed to the output later
     print(f"\nReading contacts from: {input_file}")
 
-    with open(input_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames
-        contacts = list(reader)
+    _, emails = read_emails(input_path)
 
-    print(f"Total contacts: {len(contacts)}")
+    print(f"Total contacts: {len(emails)}")
 
     # Validate each contact
-    valid_contacts = []
-    invalid_contacts = []
+    keep = []
+    invalid_reasons = Counter()
 
     print("\nValidating email addresses...")
 
-    for i, contact in enumerate(contacts, 1):
-        email = contact.get('EMAIL', '').strip()
+    # Malformed addresses are rejected up front, without a DNS lookup
+    shape_ok = well_formed(emails)
+
+    # Each domain is looked up once, however many contacts share it
+    domains = {extract_domain(email) for email, ok in zip(emails, shape_ok) if ok}
+    print(f"Unique domains: {len(domains)}")
 
-        if not email:
-            print(f"{i}/{len(contacts)}: Skipping row with no email")
-            invalid_contacts.append((contact, "No email address"))
-            continue
+    # Results are cached next to the input file until their TTL expires
+    with DomainCache(input_path.parent / DNS_CACHE_FILE) as cache:
+        domain_results = asyncio.run(validate_domains(sorted(domains), cache))
 
-        is_valid, reason = validate_email_dns(email)
+    with VerdictPrinter(len(emails)) if verbose else nullcontext() as verdict_printer:
+        for email, ok in zip(emails, shape_ok):
+            if not email:
+                is_valid, reason = False, "No email address"
+            elif ok:
+                is_valid, reason = domain_results[extract_domain(email)]
+            else:
+                is_valid, reason = False, "Invalid email format"
 
-        if is_valid:
-            valid_contacts.append(contact)
-            print(f"{i}/{len(contacts)}: ✓ {email}")
-        else:
-            invalid_contacts.append((contact, reason))
-            print(f"{i}/{len(contacts)}: ✗ {email} - {reason}")
+            keep.append(is_valid)
+            if not is_valid:
+                invalid_reasons[reason] += 1
+
+            if verdict_printer:
+                verdict_printer.advance(email, is_valid, reason)
+
+    valid_count = sum(keep)
+    invalid_count = len(emails) - valid_count
 
     # Write valid contacts to output file
-    print(f"\nWriting {len(valid_contacts)} valid contacts to: {output_file}")
+    print(f"\nWriting {valid_count} valid contacts to: {output_file}")
 
-    with open(output_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(valid_contacts)
+    write_valid_rows(input_path, output_path, keep)
 
     # Summary
     print("\n" + "="*70)
     print("DNS VALIDATION SUMMARY")
     print("="*70)
-    print(f"Total contacts processed: {len(contacts)}")
-    print(f"Valid emails: {len(valid_contacts)}")
-    print(f"Invalid emails: {len(invalid_contacts)}")
-    print(f"Removal rate: {len(invalid_contacts)/len(contacts)*100:.1f}%")
+    print(f"Total contacts processed: {len(emails)}")
+    print(f"Valid emails: {valid_count}")
+    print(f"Invalid emails: {invalid_count}")
+    print(f"Removal rate: {invalid_count/len(emails)*100:.1f}%")
 
-    if invalid_contacts:
+    if invalid_reasons:
         print("\nInvalid emails by reason:")
-        reasons = {}
-        for _, reason in invalid_contacts:
-            reasons[reason] = reasons.get(reason, 0) + 1
-
-        for reason, count in sorted(reasons.items(), key=lambda x: x[1], reverse=True):
+        for reason, count in invalid_reasons.most_common():
             print(f"  {reason}: {count}")
 
     print("="*70)
@@ -186,20 +303,30 @@ def process_contacts_file(input_file, output_file=None, create_backup=True):
 def main():
     """Main entry point."""
     if len(sys.argv) < 2:
-        print("Usage: python validate_dns.py <input_file> [output_file]")
+        print("Usage: python validate_dns.py <input_file> [output_file] [--verbose]")
+        print("\nOptions:")
+        print("  --verbose        Print the result for every contact")
         print("\nExample:")
         print("  python src/validate_dns.py output/contacts_consolidated.csv")
         print("  python src/validate_dns.py output/contacts_consolidated.csv output/contacts_dns_validated.csv")
         sys.exit(1)
 
     input_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
+    output_file = None
+    verbose = False
+
+    # Parse arguments
+    for arg in sys.argv[2:]:
+        if arg == '--verbose':
+            verbose = True
+        elif not arg.startswith('--'):
+            output_file = arg
 
     print("="*70)
     print("DNS VALIDATION")
     print("="*70)
 
-    process_contacts_file(input_file, output_file)
+    process_contacts_file(input_file, output_file, verbose=verbose)
 
 
 if __name__ == '__main__':
@@ -13,147 +13,475 @@ Emails that fail validation are removed from the output file.
 A backup of the original file is created before modification.
 """
 
-import csv
+import json
+import multiprocessing
+import queue
 import smtplib
 import dns.resolver
 import sys
 import socket
+import threading
+from collections import Counter, defaultdict
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime
-from email.utils import parseaddr
+from itertools import zip_longest
+from contacts_io import (ProgressPrinter, VerdictPrinter, backup_file, read_emails, well_formed,
+                         write_valid_rows)
+from dns_cache import (DNS_CACHE_FILE, DomainCache, extract_domain, is_failure, make_resolver,
+                       mx_hosts_from_answer)
 
+# One shared resolver
+RESOLVER = make_resolver(dns.resolver.Resolver)
 
-def extract_domain(email):
-    """Extract domain from email address."""
-    if not email or '@' not in email:
-        return None
-    return email.split('@')[1].strip().lower()
+# SMTP probes run concurrently, but at most MAX_PROBES_PER_HOST at a time
+# against any one mail server, to stay clear of anti-harvesting blocks.
+# Workers mostly wait on the network, so there are many more than CPUs
+MAX_WORKERS = 64
+MAX_PROBES_PER_HOST = 2
 
+# SMTP sessions are closed and reopened after this many RCPT TO probes
+MAX_RCPTS_PER_SESSION = 50
 
-def get_mx_hosts(domain):
+# Verdicts are checkpointed next to the output file while probing, so an
+# interrupted run can be resumed (--resume); removed once the run completes
+CHECKPOINT_SUFFIX = '.progress.jsonl'
+
+
+def get_mx_hosts(domain, cache=None):
     """
-    Get MX hosts for a domain, ordered by priority.
+    Get MX hosts for a domain, ordered by priority. A domain that exists
+    but has no MX records is its own mail host (implicit MX, RFC 5321).
 
     Args:
         domain: Domain name
+        cache: Optional DomainCache of earlier results
 
     Returns:
         list: List of MX host names ordered by priority
     """
+    if cache is not None:
+        mx_hosts = cache.get(domain, 'MX')
+        if mx_hosts is not None:
+            if is_failure(mx_hosts):
+                return [domain] if mx_hosts['error'] == 'NoAnswer' else []
+            return mx_hosts
+
     try:
-        mx_records = dns.resolver.resolve(domain, 'MX')
-        # Sort by priority (lower is higher priority)
-        mx_hosts = sorted([(r.preference, str(r.exchange).rstrip('.')) for r in mx_records])
-        return [host for _, host in mx_hosts]
+        mx_records = RESOLVER.resolve(domain, 'MX')
+        mx_hosts = mx_hosts_from_answer(mx_records)
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+        if cache is not None:
+            cache.set_failure(domain, 'MX', e)
+        return [domain] if isinstance(e, dns.resolver.NoAnswer) else []
     except Exception:
         return []
 
+    if cache is not None:
+        cache.set(domain, 'MX', mx_hosts, mx_records.rrset.ttl)
+
+    return mx_hosts
+
+
+class SMTPProber:
+    """
+    Checks mailboxes over SMTP, reusing sessions to each mail server for
+    many RCPT TO probes (with RSET in between) instead of connecting and
+    sending EHLO for every email. Safe to share between threads: each mail
+    server gets at most max_per_host sessions, one probe per session at a
+    time.
+    """
+
+    def __init__(self, timeout=10, use_fallback=True, max_per_host=MAX_PROBES_PER_HOST):
+        self.timeout = timeout
+        self.use_fallback = use_fallback
+        self.max_per_host = max_per_host
+        self.conns = {}  # MX host -> idle [session, RCPT count] pairs
+        self.slots = {}  # MX host -> Semaphore limiting sessions in use
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _acquire(self, mx_host):
+        """Wait for a free slot on mx_host and return an idle session, if any."""
+        with self.lock:
+            if mx_host not in self.slots:
+                self.slots[mx_host] = threading.Semaphore(self.max_per_host)
+                self.conns[mx_host] = []
+            slot = self.slots[mx_host]
+
+        slot.acquire()
+
+        with self.lock:
+            return self.conns[mx_host].pop() if self.conns[mx_host] else None
+
+    def _release(self, mx_host, session):
+        """Free the slot, keeping a still usable session for the next probe."""
+        if session is not None and session[1] >= MAX_RCPTS_PER_SESSION:
+            # Recycle long-lived sessions before the server drops them
+            self._discard(session)
+            session = None
+
+        if session is not None:
+            with self.lock:
+                self.conns[mx_host].append(session)
+
+        self.slots[mx_host].release()
+
+    def _discard(self, session):
+        """Close a session, ignoring errors from an already dead connection."""
+        try:
+            session[0].quit()
+        except Exception:
+            session[0].close()
+
+    def _open(self, mx_host):
+        """
+        Connect to an MX host and send EHLO (HELO for servers without ESMTP).
+
+        Returns:
+            tuple: (session or None, error message)
+        """
+        smtp = smtplib.SMTP(timeout=self.timeout)
+        try:
+            smtp.connect(mx_host, 25)
+            smtp.set_debuglevel(0)
+
+            # Get server greeting; EHLO also lists extensions like PIPELINING
+            code, message = smtp.ehlo('mail.validator.local')
+            if code != 250:
+                code, message = smtp.helo('mail.validator.local')
+        except Exception:
+            smtp.close()
+            raise
+
+        if code != 250:
+            self._discard([smtp, 0])
+            return None, f"HELO failed: {code}"
+
+        return [smtp, 0], ""
+
+    def _send_rcpt(self, session, email):
+        """
+        Send MAIL FROM and RCPT TO on an open session, then RSET it.
+        Servers advertising PIPELINING (RFC 2920) get all three commands
+        in a single send() (one TCP write, so Nagle never holds RCPT and
+        RSET back behind MAIL's ACK), then the three replies are read:
+        one round trip instead of three.
+
+        Returns:
+            tuple: (RCPT TO reply code or None, error message)
+        """
+        smtp = session[0]
+
+        if smtp.has_extn('pipelining'):
+            smtp.send(
+                'MAIL FROM:<validator@validator.local>\r\n'
+                f'RCPT TO:{smtplib.quoteaddr(email)}\r\n'
+                'RSET\r\n'
+            )
+
+            mail_code, _ = smtp.getreply()
+            code, message = smtp.getreply()
+            smtp.getreply()
+            session[1] += 1
+
+            if mail_code != 250:
+                return None, f"MAIL FROM failed: {mail_code}"
+
+            return code, ""
+
+        # Set a fake sender (required for RCPT TO)
+        code, message = smtp.mail('validator@validator.local')
+
+        if code != 250:
+            return None, f"MAIL FROM failed: {code}"
+
+        # Try to verify recipient
+        code, message = smtp.rcpt(email)
+        session[1] += 1
+
+        # Ready the session for the next probe
+        smtp.rset()
+
+        return code, ""
+
+    def _probe_host(self, mx_host, email):
+        """
+        Probe one email against one MX host.
+
+        Returns:
+            tuple: (RCPT TO reply code or None, error message)
+        """
+        session = self._acquire(mx_host)
+        try:
+            if session is not None:
+                try:
+                    return self._send_rcpt(session, email)
+                except smtplib.SMTPServerDisconnected:
+                    # The server dropped the idle session; start a new one
+                    session[0].close()
+                    session = None
+
+            session, error = self._open(mx_host)
+            if session is None:
+                return None, error
+
+            return self._send_rcpt(session, email)
+
+        except Exception:
+            if session is not None:
+                session[0].close()
+                session = None
+            raise
+
+        finally:
+            self._release(mx_host, session)
+
+    def probe(self, email, mx_hosts=None):
+        """
+        Validate email by checking mailbox existence on its mail servers.
+
+        Args:
+            email: Email address to validate
+            mx_hosts: MX hosts of the email's domain, if already looked up
+
+        Returns:
+            tuple: (is_valid, reason, details)
+        """
+        domain = extract_domain(email)
+
+        if not domain:
+            return False, "Invalid email format", ""
+
+        # Get MX hosts
+        if mx_hosts is None:
+            mx_hosts = get_mx_hosts(domain)
+
+        if not mx_hosts:
+            return False, "No MX records found", ""
+
+        # Try each MX host
+        last_error = ""
+
+        for mx_host in mx_hosts:
+            try:
+                code, error = self._probe_host(mx_host, email)
+            except smtplib.SMTPServerDisconnected:
+                last_error = f"{mx_host}: Server disconnected"
+                continue
+            except smtplib.SMTPConnectError as e:
+                last_error = f"{mx_host}: Connection failed"
+                continue
+            except socket.timeout:
+                last_error = f"{mx_host}: Connection timeout"
+                continue
+            except socket.gaierror:
+                last_error = f"{mx_host}: Cannot resolve hostname"
+                continue
+            except Exception as e:
+                last_error = f"{mx_host}: {type(e).__name__}"
+                continue
+
+            if code is None:
+                last_error = error
+                continue
+
+            # Response codes:
+            # 250 = mailbox exists
+            # 251 = user not local, will forward (accept as valid)
+            # 252 = cannot verify, but will accept message (greylisting)
+            # 450-451 = temporary failure
+            # 550-551 = mailbox doesn't exist
+            # 552-553 = exceeded storage / policy
+
+            if code == 250:
+                return True, "Mailbox verified", f"{mx_host}: {code}"
+            elif code == 251:
+                return True, "Will forward", f"{mx_host}: {code}"
+            elif code == 252:
+                # Server won't verify but will accept
+                if self.use_fallback:
+                    return True, "Cannot verify (accepting)", f"{mx_host}: {code}"
+                else:
+                    return False, "Cannot verify", f"{mx_host}: {code}"
+            elif code in [450, 451]:
+                # Temporary failure, try next MX
+                last_error = f"{mx_host}: Temporary failure ({code})"
+                continue
+            elif code >= 550:
+                # Permanent failure
+                return False, "Mailbox does not exist", f"{mx_host}: {code}"
+            else:
+                last_error = f"{mx_host}: Unexpected code {code}"
+                continue
+
+        # If we got here, all MX hosts failed
+        if self.use_fallback:
+            # Conservative approach: assume valid if we can't verify
+            return True, "Cannot verify (accepting)", last_error
+        else:
+            return False, "All MX hosts failed", last_error
+
+    def close(self):
+        """Close all idle sessions."""
+        with self.lock:
+            sessions = [session for idle in self.conns.values() for session in idle]
+            self.conns = {mx_host: [] for mx_host in self.conns}
+
+        for session in sessions:
+            self._discard(session)
+
 
-def validate_email_smtp(email, timeout=10, use_fallback=True):
+def validate_email_smtp(email, timeout=10, use_fallback=True, mx_hosts=None):
     """
     Validate email by connecting to SMTP server and checking mailbox existence.
+    Uses a one-off SMTPProber; share an SMTPProber to reuse connections.
 
     Args:
         email: Email address to validate
         timeout: Connection timeout in seconds
         use_fallback: If True, assume valid if server doesn't support verification
+        mx_hosts: MX hosts of the email's domain, if already looked up
 
     Returns:
         tuple: (is_valid, reason, details)
     """
-    domain = extract_domain(email)
+    with SMTPProber(timeout, use_fallback) as prober:
+        return prober.probe(email, mx_hosts)
+
+
+def probe_emails(jobs, timeout=10, use_fallback=True):
+    """
+    Probe emails concurrently on a thread pool.
+
+    Args:
+        jobs: List of (row index, email, MX hosts), in submission order
+        timeout: SMTP connection timeout in seconds
+        use_fallback: If True, assume valid if server doesn't support verification
+
+    Yields:
+        tuple: (row index, is_valid, reason), as probes finish
+    """
+    # One prober shared by all threads: sessions to each mail server are
+    # reused across emails, and capped per server
+    with SMTPProber(timeout, use_fallback) as prober:
+        executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        try:
+            futures = {executor.submit(prober.probe, email, mx_hosts): i for i, email, mx_hosts in jobs}
+
+            for future in as_completed(futures):
+                is_valid, reason, details = future.result()
+                yield futures[future], is_valid, reason
+        finally:
+            # On Ctrl+C (or any early exit) drop the queued probes instead
+            # of waiting for all of them; only those in flight still finish
+            executor.shutdown(wait=False, cancel_futures=True)
+
 
-    if not domain:
-        return False, "Invalid email format", ""
+def _probe_shard(jobs, timeout, use_fallback, results):
+    """Probe one shard of emails in a worker process, sending each verdict to results."""
+    for verdict in probe_emails(jobs, timeout, use_fallback):
+        results.put(verdict)
 
-    # Get MX hosts
-    mx_hosts = get_mx_hosts(domain)
 
-    if not mx_hosts:
-        return False, "No MX records found", ""
+def probe_emails_in_processes(jobs, processes, timeout=10, use_fallback=True):
+    """
+    Probe emails across worker processes, each running probe_emails with
+    its own thread pool and SMTPProber, so CPU-heavy session work (such
+    as TLS handshakes) is spread over several cores. Emails whose MX
+    lists share any host (primary or fallback) go to the same process,
+    so each server's sessions and its MAX_PROBES_PER_HOST limit stay
+    within one process.
 
-    # Try each MX host
-    last_error = ""
+    Args:
+        jobs: List of (row index, email, MX hosts), in submission order
+        processes: Number of worker processes
+        timeout: SMTP connection timeout in seconds
+        use_fallback: If True, assume valid if server doesn't support verification
 
-    for mx_host in mx_hosts:
+    Yields:
+        tuple: (row index, is_valid, reason), as probes finish
+    """
+    # Union-find over MX hosts: a host may be primary for one domain and
+    # a fallback for another, and probe() can reach either
+    parent = {}
+
+    def find(host):
+        while parent.setdefault(host, host) != host:
+            parent[host] = parent[parent[host]]
+            host = parent[host]
+        return host
+
+    for _, _, mx_hosts in jobs:
+        for host in (mx_hosts or [])[1:]:
+            parent[find(host)] = find(mx_hosts[0])
+
+    shards = [[] for _ in range(processes)]
+    for job in jobs:
+        mx_hosts = job[2]
+        shards[hash(find(mx_hosts[0]) if mx_hosts else '') % processes].append(job)
+
+    with multiprocessing.Manager() as manager:
+        results = manager.Queue()
+        executor = ProcessPoolExecutor(max_workers=processes)
         try:
-            # Connect to SMTP server
-            with smtplib.SMTP(timeout=timeout) as smtp:
-                smtp.connect(mx_host, 25)
-                smtp.set_debuglevel(0)
+            futures = [
+                executor.submit(_probe_shard, shard, timeout, use_fallback, results)
+                for shard in shards if shard
+            ]
+
+            for _ in range(len(jobs)):
+                while True:
+                    try:
+                        verdict = results.get(timeout=1)
+                        break
+                    except queue.Empty:
+                        # Raise a worker's error instead of waiting forever
+                        for future in futures:
+                            if future.done() and future.exception():
+                                raise future.exception()
+
+                yield verdict
+        finally:
+            # As in probe_emails, don't wait for the remaining probes on an
+            # early exit; workers stop once the results queue is gone
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def load_checkpoint(checkpoint_path):
+    """
+    Read the verdicts saved by an earlier, interrupted run.
 
-                # Get server greeting
-                code, message = smtp.helo('mail.validator.local')
+    Args:
+        checkpoint_path: Path to the checkpoint file
 
-                if code != 250:
-                    last_error = f"HELO failed: {code}"
-                    continue
-
-                # Set a fake sender (required for RCPT TO)
-                code, message = smtp.mail('validator@validator.local')
-
-                if code != 250:
-                    last_error = f"MAIL FROM failed: {code}"
-                    continue
-
-                # Try to verify recipient
-                code, message = smtp.rcpt(email)
-
-                # Response codes:
-                # 250 = mailbox exists
-                # 251 = user not local, will forward (accept as valid)
-                # 252 = cannot verify, but will accept message (greylisting)
-                # 450-451 = temporary failure
-                # 550-551 = mailbox doesn't exist
-                # 552-553 = exceeded storage / policy
-
-                if code == 250:
-                    return True, "Mailbox verified", f"{mx_host}: {code}"
-                elif code == 251:
-                    return True, "Will forward", f"{mx_host}: {code}"
-                elif code == 252:
-                    # Server won't verify but will accept
-                    if use_fallback:
-                        return True, "Cannot verify (accepting)", f"{mx_host}: {code}"
-                    else:
-                        return False, "Cannot verify", f"{mx_host}: {code}"
-                elif code in [450, 451]:
-                    # Temporary failure, try next MX
-                    last_error = f"{mx_host}: Temporary failure ({code})"
-                    continue
-                elif code >= 550:
-                    # Permanent failure
-                    return False, "Mailbox does not exist", f"{mx_host}: {code}"
-                else:
-                    last_error = f"{mx_host}: Unexpected code {code}"
-                    continue
-
-        except smtplib.SMTPServerDisconnected:
-            last_error = f"{mx_host}: Server disconnected"
-            continue
-        except smtplib.SMTPConnectError as e:
-            last_error = f"{mx_host}: Connection failed"
-            continue
-        except socket.timeout:
-            last_error = f"{mx_host}: Connection timeout"
-            continue
-        except socket.gaierror:
-            last_error = f"{mx_host}: Cannot resolve hostname"
-            continue
-        except Exception as e:
-            last_error = f"{mx_host}: {type(e).__name__}"
-            continue
-
-    # If we got here, all MX hosts failed
-    if use_fallback:
-        # Conservative approach: assume valid if we can't verify
-        return True, "Cannot verify (accepting)", last_error
-    else:
-        return False, "All MX hosts failed", last_error
+    Returns:
+        dict: Email -> (is_valid, reason)
+    """
+    verdicts = {}
+    if not checkpoint_path.exists():
+        return verdicts
+
+    with open(checkpoint_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Last line, cut short by the interruption
+
+            verdicts[entry['email']] = (entry['valid'], entry['reason'])
+
+    return verdicts
 
 
 def process_contacts_file(input_file, output_file=None, create_backup=True,
-                         timeout=10, use_fallback=True):
+                         timeout=10, use_fallback=True, resume=False, verbose=False,
+                         processes=1):
     """
     Process contacts file and remove entries with invalid email addresses.
 
@@ -163,6 +491,9 @@ def process_contacts_file(input_file, output_file=None, create_backup=True,
         create_backup: Whether to create a backup of the original file
         timeout: SMTP connection timeout in seconds
         use_fallback: If True, assume valid if server doesn't support verification
+        resume: If True, reuse the verdicts checkpointed by an interrupted run
+        verbose: If True, print the verdict for every probed email
+        processes: Number of worker processes probing in parallel
     """
     input_path = Path(input_file)
 
@@ -178,73 +509,120 @@ def process_contacts_file(input_file, output_file=None, create_backup=True,
 
     # Create backup if requested
     if create_backup:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = input_path.parent / f"{input_path.stem}_backup_{timestamp}{input_path.suffix}"
-        print(f"Creating backup: {backup_path}")
-
-        with open(input_path, 'r', encoding='utf-8') as src, \
-             open(backup_path, 'w', encoding='utf-8', newline='') as dst:
-            dst.write(src.read())
+        backup_file(input_path)
 
-    # Read all contacts
+    # Read the email addresses; rows are streamed to the output later
     print(f"\nReading contacts from: {input_file}")
 
-    with open(input_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames
-        contacts = list(reader)
+    _, emails = read_emails(input_path)
 
-    print(f"Total contacts: {len(contacts)}")
+    print(f"Total contacts: {len(emails)}")
+
+    # Malformed addresses are rejected up front, without any network traffic
+    shape_ok = well_formed(emails)
+
+    checkpoint_path = output_path.with_suffix(CHECKPOINT_SUFFIX)
+    verdicts = load_checkpoint(checkpoint_path) if resume else {}
+    if verdicts:
+        print(f"Resuming: {len(verdicts)} emails already checked")
+
+    # Only emails without a verdict from an earlier run are probed
+    pending = [i for i, ok in enumerate(shape_ok) if ok and emails[i] not in verdicts]
+
+    # Look up MX hosts once per domain, however many contacts share it
+    domains = {extract_domain(emails[i]) for i in pending}
+    print(f"Unique domains: {len(domains)}")
+
+    # Results are cached next to the input file until their TTL expires
+    with DomainCache(input_path.parent / DNS_CACHE_FILE) as cache:
+        mx_cache = {domain: get_mx_hosts(domain, cache) for domain in sorted(domains)}
 
     # Validate each contact
-    valid_contacts = []
-    invalid_contacts = []
+    keep = [False] * len(emails)
+    invalid_reasons = Counter()
 
     print("\nValidating email addresses via SMTP...")
     print(f"Settings: timeout={timeout}s, fallback={'enabled' if use_fallback else 'disabled'}")
     print("Note: This may take a while...\n")
 
-    for i, contact in enumerate(contacts, 1):
-        email = contact.get('EMAIL', '').strip()
+    with open(checkpoint_path, 'a' if resume else 'w', encoding='utf-8') as checkpoint:
+        missing = emails.count('')
+        if missing:
+            invalid_reasons["No email address"] = missing
+
+        malformed = len(emails) - missing - sum(shape_ok)
+        if malformed:
+            invalid_reasons["Invalid email format"] = malformed
+
+        for i, ok in enumerate(shape_ok):
+            if ok and emails[i] in verdicts:
+                is_valid, reason = verdicts[emails[i]]
+                keep[i] = is_valid
+                if not is_valid:
+                    invalid_reasons[reason] += 1
+
+        # Group emails by mail server, then submit them round-robin across
+        # servers. Sessions are still reused (the prober pools them per
+        # server), but the workers are spread over many servers instead of
+        # queueing behind one server's MAX_PROBES_PER_HOST slots. Results
+        # are stored by row index, so the output keeps the original order.
+        def server_order(i):
+            domain = extract_domain(emails[i]) or ''
+            mx_hosts = mx_cache.get(domain)
+            return (mx_hosts[0] if mx_hosts else '', domain)
+
+        by_server = defaultdict(list)
+        for i in sorted(pending, key=server_order):
+            by_server[server_order(i)[0]].append(i)
+
+        jobs = [
+            (i, emails[i], mx_cache.get(extract_domain(emails[i])))
+            for batch in zip_longest(*by_server.values())
+            for i in batch if i is not None
+        ]
+
+        if processes > 1:
+            results = probe_emails_in_processes(jobs, processes, timeout, use_fallback)
+        else:
+            results = probe_emails(jobs, timeout, use_fallback)
 
-        if not email:
-            print(f"{i}/{len(contacts)}: Skipping row with no email")
-            invalid_contacts.append((contact, "No email address"))
-            continue
+        progress = ProgressPrinter(len(jobs), "Emails probed")
+        with VerdictPrinter(len(jobs)) if verbose else nullcontext() as verdict_printer:
+            for i, is_valid, reason in results:
+                if verdict_printer:
+                    verdict_printer.advance(emails[i], is_valid, reason)
+                else:
+                    progress.advance()
 
-        is_valid, reason, details = validate_email_smtp(email, timeout, use_fallback)
+                # Flushed per verdict, so a crash loses at most the probes in flight
+                checkpoint.write(json.dumps({'email': emails[i], 'valid': is_valid, 'reason': reason}) + '\n')
+                checkpoint.flush()
 
-        if is_valid:
-            valid_contacts.append(contact)
-            print(f"{i}/{len(contacts)}: ✓ {email} - {reason}")
-        else:
-            invalid_contacts.append((contact, reason))
-            print(f"{i}/{len(contacts)}: ✗ {email} - {reason}")
+                keep[i] = is_valid
+                if not is_valid:
+                    invalid_reasons[reason] += 1
 
-    # Write valid contacts to output file
-    print(f"\nWriting {len(valid_contacts)} valid contacts to: {output_file}")
+    valid_count = sum(keep)
+    invalid_count = len(emails) - valid_count
 
-    with open(output_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(valid_contacts)
+    # Write valid contacts to output file, in the original row order
+    print(f"\nWriting {valid_count} valid contacts to: {output_file}")
+
+    write_valid_rows(input_path, output_path, keep)
+    checkpoint_path.unlink()
 
     # Summary
     print("\n" + "="*70)
     print("SMTP VALIDATION SUMMARY")
     print("="*70)
-    print(f"Total contacts processed: {len(contacts)}")
-    print(f"Valid emails: {len(valid_contacts)}")
-    print(f"Invalid emails: {len(invalid_contacts)}")
-    print(f"Removal rate: {len(invalid_contacts)/len(contacts)*100:.1f}%")
+    print(f"Total contacts processed: {len(emails)}")
+    print(f"Valid emails: {valid_count}")
+    print(f"Invalid emails: {invalid_count}")
+    print(f"Removal rate: {invalid_count/len(emails)*100:.1f}%")
 
-    if invalid_contacts:
+    if invalid_reasons:
         print("\nInvalid emails by reason:")
-        reasons = {}
-        for _, reason in invalid_contacts:
-            reasons[reason] = reasons.get(reason, 0) + 1
-
-        for reason, count in sorted(reasons.items(), key=lambda x: x[1], reverse=True):
+        for reason, count in invalid_reasons.most_common():
             print(f"  {reason}: {count}")
 
     print("\n" + "="*70)
@@ -259,10 +637,13 @@ def process_contacts_file(input_file, output_file=None, create_backup=True,
 def main():
     """Main entry point."""
     if len(sys.argv) < 2:
-        print("Usage: python validate_smtp.py <input_file> [output_file] [--no-fallback] [--timeout=N]")
+        print("Usage: python validate_smtp.py <input_file> [output_file] [--no-fallback] [--timeout=N] [--resume] [--verbose] [--processes=N]")
         print("\nOptions:")
         print("  --no-fallback    Only accept emails that are positively verified")
         print("  --timeout=N      Set connection timeout in seconds (default: 10)")
+        print("  --resume         Skip emails already checked by an interrupted run")
+        print("  --verbose        Print the result for every email")
+        print("  --processes=N    Probe from N worker processes (default: 1)")
         print("\nExamples:")
         print("  python src/validate_smtp.py output/contacts_consolidated.csv")
         print("  python src/validate_smtp.py output/contacts_consolidated.csv output/contacts_smtp_validated.csv")
@@ -273,13 +654,22 @@ def main():
     output_file = None
     use_fallback = True
     timeout = 10
+    resume = False
+    verbose = False
+    processes = 1
 
     # Parse arguments
     for arg in sys.argv[2:]:
         if arg == '--no-fallback':
             use_fallback = False
+        elif arg == '--resume':
+            resume = True
+        elif arg == '--verbose':
+            verbose = True
         elif arg.startswith('--timeout='):
             timeout = int(arg.split('=')[1])
+        elif arg.startswith('--processes='):
+            processes = int(arg.split('=')[1])
         elif not arg.startswith('--'):
             output_file = arg
 
@@ -287,7 +677,8 @@ def main():
     print("SMTP MAILBOX VALIDATION")
     print("="*70)
 
-    process_contacts_file(input_file, output_file, timeout=timeout, use_fallback=use_fallback)
+    process_contacts_file(input_file, output_file, timeout=timeout, use_fallback=use_fallback,
+                          resume=resume, verbose=verbose, processes=processes)
 
 
 if __name__ == '__main__':
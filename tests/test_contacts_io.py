@@ -0,0 +1,49 @@
+"""
+Tests for the CSV helpers shared by the validation scripts.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from contacts_io import read_emails, write_valid_rows
+
+
+def filter_csv(tmp_path, text, is_valid):
+    """Run read_emails then write_valid_rows on text, keeping emails that pass is_valid."""
+    input_path = tmp_path / 'contacts.csv'
+    output_path = tmp_path / 'out.csv'
+    input_path.write_text(text, encoding='utf-8', newline='')
+
+    _, emails = read_emails(input_path)
+    write_valid_rows(input_path, output_path, [is_valid(email) for email in emails])
+
+    return emails, output_path.read_text(encoding='utf-8').splitlines()
+
+
+def test_whitespace_only_line_is_a_row_in_both_passes(tmp_path):
+    emails, lines = filter_csv(
+        tmp_path, 'EMAIL,NAME\na@b.com,A\n   \nc@d.com,C\n', lambda email: '@' in email
+    )
+
+    assert emails == ['a@b.com', '', 'c@d.com']
+    assert lines == ['EMAIL,NAME', 'a@b.com,A', 'c@d.com,C']
+
+
+def test_row_longer_than_header_keeps_email_column(tmp_path):
+    emails, lines = filter_csv(
+        tmp_path, 'EMAIL,NAME\na@b.com,A,\nc@d.com,C,\n', lambda email: email == 'c@d.com'
+    )
+
+    assert emails == ['a@b.com', 'c@d.com']
+    assert lines == ['EMAIL,NAME', 'c@d.com,C,']
+
+
+def test_empty_line_is_not_a_contact(tmp_path):
+    emails, lines = filter_csv(
+        tmp_path, 'NAME,EMAIL\nA,a@b.com\n\n   \nC,c@d.com\n', lambda email: '@' in email
+    )
+
+    assert emails == ['a@b.com', '', 'c@d.com']
+    assert lines == ['NAME,EMAIL', 'A,a@b.com', 'C,c@d.com']